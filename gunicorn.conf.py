@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration - Chartastrophe
+Loaded automatically by gunicorn from the working directory (Procfile, render.yaml).
+"""
+import gc
+import os
+
+# Import the application once in the master process, before forking workers:
+# engines, translations and the imported libraries are then shared copy-on-write
+preload_app = True
+
+# A single process: the correlation cache (with its plot data), the share image cache
+# and the fallback rate limiter live in process memory, so a second worker would answer
+# 404 for ids generated by the first. Concurrency comes from the thread pool instead
+# (requests mostly wait on external data APIs). WEB_CONCURRENCY is deliberately ignored.
+workers = 1
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+def when_ready(server):
+    """Warm up shared read-only data in the master process before workers are forked."""
+    from src.services.translation_service import translation_service
+    
+    stats = translation_service.get_usage_stats()
+    server.log.info(f"Translations preloaded: {stats['pretranslated_entries']} entries")
+    
+    # Move everything allocated so far out of the garbage collector's reach so that
+    # collections in the workers do not touch (and copy) the shared pages
+    gc.freeze()
\ No newline at end of file
@@ -70,6 +70,8 @@ def main():
             print(f"⚠️  Déjà présent: {english}")
     
     # Mettre à jour les métadonnées
+    # Entrées modifiées sans normalisation : le service réappliquera les corrections courantes
+    data['metadata'].pop('normalized', None)
     data['metadata']['total_translations'] = len(data['translations'])
     data['metadata']['climate_datasets_added'] = translations_added
     data['metadata']['last_climate_update'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -161,6 +161,8 @@ def add_contextual_translations():
             print(f"➕ Ajouté: '{english}' → '{french}'")
     
     # Mettre à jour les métadonnées
+    # Entrées modifiées sans normalisation : le service réappliquera les corrections courantes
+    data['metadata'].pop('normalized', None)
     data['metadata']['contextual_translations_added'] = added_count
     data['metadata']['contextual_translations_updated'] = updated_count
     data['metadata']['last_contextual_update'] = "2025-06-06 15:10:00"
@@ -227,6 +227,8 @@ def main():
             print(f"⚠️  Déjà présent: {english}")
     
     # Mettre à jour les métadonnées
+    # Entrées modifiées sans normalisation : le service réappliquera les corrections courantes
+    data['metadata'].pop('normalized', None)
     data['metadata']['total_translations'] = len(data['translations'])
     data['metadata']['specific_datasets_added'] = translations_added
     data['metadata']['last_specific_update'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
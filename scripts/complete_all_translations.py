@@ -215,6 +215,8 @@ def main():
         print("✅ Toutes les traductions sont déjà présentes!")
     else:
         # Mettre à jour les métadonnées
+        # Entrées modifiées sans normalisation : le service réappliquera les corrections courantes
+        data['metadata'].pop('normalized', None)
         data['metadata']['version'] = "4.0"
         data['metadata']['last_updated'] = datetime.now().isoformat()
         data['metadata']['total_translations'] = len(data['translations'])
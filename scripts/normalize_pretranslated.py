@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Script de normalisation des traductions pré-générées.
+Applique une fois pour toutes les corrections courantes au fichier JSON,
+ce qui évite au service de traduction de les appliquer à chaque démarrage.
+
+Usage: python scripts/normalize_pretranslated.py
+"""
+
+import sys
+import os
+import json
+import time
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.translation_service import apply_common_fixes
+
+def main():
+    """Fonction principale."""
+    translations_file = Path("data/pretranslated_datasets.json")
+    
+    if not translations_file.exists():
+        print("❌ Fichier pretranslated_datasets.json non trouvé")
+        return
+    
+    # Charger le fichier existant
+    with open(translations_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    translations = data.get('translations', {})
+    print(f"📊 État actuel: {len(translations)} traductions")
+    
+    # Appliquer les corrections courantes
+    fixes_applied = 0
+    for english, french in translations.items():
+        corrected = apply_common_fixes(french)
+        if corrected != french:
+            translations[english] = corrected
+            fixes_applied += 1
+            print(f"🔧 Correction appliquée: '{french}' → '{corrected}'")
+    
+    # Marquer le fichier comme normalisé (le service ignore alors ses corrections au démarrage)
+    metadata = data.setdefault('metadata', {})
+    metadata['normalized'] = True
+    metadata['last_normalized'] = time.strftime("%Y-%m-%d %H:%M:%S")
+    
+    # Écriture atomique : fichier temporaire puis remplacement
+    temp_file = translations_file.with_suffix('.json.tmp')
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_file, translations_file)
+    
+    print(f"✅ {fixes_applied} corrections appliquées, {len(translations)} traductions normalisées")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -25,6 +25,7 @@ except ImportError:
 
 from src.config import DEEPL_CONFIG
 from src.collectors.real_data_collector import RealSourceGenerator
+from src.services.translation_service import apply_common_fixes
 
 def collect_all_dataset_names():
     """Collecte tous les noms de datasets possibles."""
@@ -139,13 +140,17 @@ def save_translations(translations, output_file):
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
+    # Appliquer dès maintenant les corrections courantes (fichier normalisé)
+    translations = {english: apply_common_fixes(french) for english, french in translations.items()}
+    
     # Ajouter des métadonnées
     data = {
         "metadata": {
             "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
             "total_translations": len(translations),
             "deepl_api_used": True,
-            "version": "1.0"
+            "version": "1.0",
+            "normalized": True
         },
         "translations": translations
     }
@@ -4,7 +4,6 @@ Correlation analyzer between data series.
 from typing import Optional, Dict, Any, Tuple
 import pandas as pd
 import numpy as np
-from scipy import stats
 import logging
 import uuid
 
@@ -41,10 +40,11 @@ class CorrelationResult:
 class CorrelationAnalyzer:
     def __init__(self):
         logger.debug("Correlation analyzer initialization")
+        # scipy.stats functions, resolved on first use (scipy.stats is slow to import)
         self.correlation_methods = {
-            'pearson': stats.pearsonr,
-            'spearman': stats.spearmanr,
-            'kendall': stats.kendalltau
+            'pearson': 'pearsonr',
+            'spearman': 'spearmanr',
+            'kendall': 'kendalltau'
         }
 
     def analyze_pair(self,
@@ -99,7 +99,8 @@ class CorrelationAnalyzer:
                 logger.warning(f"Method {method} not supported, using Pearson")
                 method = 'pearson'
                 
-            corr_func = self.correlation_methods[method]
+            from scipy import stats
+            corr_func = getattr(stats, self.correlation_methods[method])
             correlation_coefficient, p_value = corr_func(s1_transformed, s2_transformed)
             
             logger.debug(f"Correlation calculated: {correlation_coefficient:.3f} (p={p_value:.3f})")
@@ -3,22 +3,82 @@ Correlation engine for analyzing and finding relationships between different dat
 """
 import pandas as pd
 import numpy as np
+from scipy import special  # scipy.stats is imported where needed (slow to import)
 from typing import List, Dict, Optional, Union, Tuple
 from datetime import datetime
 import uuid
 import logging
-from collections import defaultdict, deque
+from collections import defaultdict, deque, OrderedDict
+import hashlib
+import multiprocessing
+import os
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 from ..collectors.real_data_collector import RealDataCollector
-from ..correlation.correlation_analyzer import CorrelationAnalyzer
+from ..correlation.correlation_analyzer import CorrelationAnalyzer, CorrelationResult
 from ..generator.explanation_generator import ExplanationGenerator
 from ..data_sources import SOURCES
-from ..config import CORRELATION_CONFIG
+from ..config import CORRELATION_CONFIG, PERFORMANCE_CONFIG
 from ..feedback.user_feedback import user_feedback
 
 logger = logging.getLogger(__name__)
 
+# Columnar record of a correlation found by find_correlations(as_array=True):
+# column indices are positions within their dataset (datasets[d].columns[c])
+CORRELATION_DTYPE = np.dtype([
+    ('dataset1_index', np.int32),
+    ('column1_index', np.int32),
+    ('dataset2_index', np.int32),
+    ('column2_index', np.int32),
+    ('correlation', np.float64),
+    ('p_value', np.float64)
+])
+
+# Maximum number of Kendall results kept by calculate_correlation
+CORRELATION_CACHE_SIZE = 10000
+
+# Pairs found by the find_correlations paths: (column a, column b, coefficients, p-values)
+PairArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+# Cross-dataset blocks of the upper triangle: (columns of one dataset, columns of the datasets after it)
+PairBlocks = List[Tuple[slice, slice]]
+
+# Pairwise path: number of pairs per worker process below which it stays sequential
+# (measured: a pair costs 80-200 us, a worker about 10 ms to start once the forkserver
+# is running, so 2 workers pay off from about 2 x 1024 pairs)
+PARALLEL_MIN_PAIRS = 1024
+
+def available_cpus() -> int:
+    """CPUs this process may run on (affinity mask, not the host's core count)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def pairwise_mp_context():
+    """
+    Start method of the pairwise worker processes. Forking a multi-threaded server
+    process can deadlock on locks held by other threads: workers are forked from a
+    single-threaded forkserver that imports this module once (spawn where unavailable).
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload([__name__, 'scipy.stats'])
+    return context
+
+# Data shared by the pairwise worker processes (set once per process by the initializer)
+_pairwise_worker_args = None
+
+def _init_pairwise_worker(X: np.ndarray, method: str, threshold: float):
+    global _pairwise_worker_args
+    _pairwise_worker_args = (X, method, threshold)
+
+def _correlate_pairs_in_worker(pairs_a: np.ndarray, pairs_b: np.ndarray) -> List[Tuple[int, int, float, float]]:
+    X, method, threshold = _pairwise_worker_args
+    return CorrelationEngine._correlate_pairs(X, pairs_a, pairs_b, method, threshold)
+
 class CorrelationEngine:
     def __init__(self):
         logger.debug("Initializing correlation engine")
@@ -37,6 +97,10 @@ class CorrelationEngine:
         self.dataset_usage_count = defaultdict(int)  # Usage counter per dataset
         self.max_dataset_reuse = 2  # Maximum reuses of a dataset before avoiding it (reduced from 3 to 2)
         
+        # LRU cache of calculate_correlation results, keyed on the content of the series
+        self.correlation_cache = OrderedDict()
+        self.correlation_cache_lock = threading.Lock()
+        
     def _get_cached_datasets(self, n_datasets: int = 5, lang: str = 'en') -> Dict[str, pd.Series]:
         """Retrieve datasets from cache or generate them."""
         current_time = time.time()
@@ -314,10 +378,121 @@ class CorrelationEngine:
         else:
             raise Exception("No correlation found")
 
+    def calculate_correlation(self,
+                              series1: pd.Series,
+                              series2: pd.Series,
+                              method: str = 'pearson') -> Tuple[float, float]:
+        """
+        Calculate the correlation between two series, ignoring missing values.
+        
+        Args:
+            series1: First data series
+            series2: Second data series
+            method: Correlation method ('pearson', 'spearman', or 'kendall')
+            
+        Returns:
+            Tuple (correlation coefficient, p-value)
+        """
+        if method not in self.correlation_methods:
+            raise ValueError(f"Method {method} not supported. Use: {list(self.correlation_methods)}")
+        
+        if (pd.api.types.is_numeric_dtype(series1) and pd.api.types.is_numeric_dtype(series2)
+                and series1.index.equals(series2.index)):
+            # Aligned numeric series: numpy views of float64 columns (no copy),
+            # rows are only copied when some values are missing
+            x = series1.to_numpy(dtype=np.float64, na_value=np.nan, copy=False)
+            y = series2.to_numpy(dtype=np.float64, na_value=np.nan, copy=False)
+            mask = ~(np.isnan(x) | np.isnan(y))
+            if not mask.all():
+                x, y = x[mask], y[mask]
+        else:
+            s1 = pd.to_numeric(series1, errors='coerce')
+            s2 = pd.to_numeric(series2, errors='coerce')
+            mask = ~(s1.isna() | s2.isna())
+            x = s1[mask].to_numpy(dtype=np.float64)
+            y = s2[mask].to_numpy(dtype=np.float64)
+        
+        # Pearson and Spearman cost less than hashing the data: only Kendall is memoized
+        # (identical data, same values and same pairing, gives the same result)
+        if method != 'kendall':
+            return self._correlate(x, y, method)
+        
+        key = (self._fingerprint(x), self._fingerprint(y))
+        with self.correlation_cache_lock:
+            result = self.correlation_cache.get(key)
+            if result is not None:
+                self.correlation_cache.move_to_end(key)
+                return result
+        
+        result = self._correlate(x, y, method)
+        with self.correlation_cache_lock:
+            self.correlation_cache[key] = result
+            while len(self.correlation_cache) > CORRELATION_CACHE_SIZE:
+                self.correlation_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _fingerprint(values: np.ndarray) -> bytes:
+        """Content hash of a float64 column."""
+        return hashlib.blake2b(np.ascontiguousarray(values).tobytes(), digest_size=16).digest()
+
+    @staticmethod
+    def _correlate(x: np.ndarray, y: np.ndarray, method: str) -> Tuple[float, float]:
+        """Correlate two aligned arrays without missing values."""
+        if len(x) < 2:
+            raise ValueError("At least 2 valid data points are required")
+        
+        if method == 'kendall':
+            from scipy.stats import kendalltau
+            coef, p_val = kendalltau(x, y)
+            return float(coef), float(p_val)
+        
+        # Spearman is Pearson on ranks
+        if method == 'spearman':
+            from scipy.stats import rankdata
+            x, y = rankdata(x), rankdata(y)
+        return CorrelationEngine._pearson_from_prepared(CorrelationEngine._prepare(x),
+                                                        CorrelationEngine._prepare(y),
+                                                        len(x))
+
+    @staticmethod
+    def _prepare(values: np.ndarray) -> np.ndarray:
+        """Center and L2-normalize a column: Pearson then reduces to a dot product."""
+        centered = values - values.mean()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.ascontiguousarray(centered / np.linalg.norm(centered), dtype=np.float64)
+
+    @staticmethod
+    def _pearson_from_prepared(x_tilde: np.ndarray, y_tilde: np.ndarray, n: int) -> Tuple[float, float]:
+        """Pearson coefficient and p-value of two prepared columns."""
+        coef = float(np.clip(x_tilde @ y_tilde, -1.0, 1.0))
+        return coef, CorrelationEngine._pearson_p_value(coef, n)
+
+    @staticmethod
+    def _pearson_p_value(coef: float, n: int) -> float:
+        """Two-sided p-value of a Pearson coefficient (t-test with n-2 degrees of freedom)."""
+        return float(CorrelationEngine._pearson_p_values(coef, n))
+
+    @staticmethod
+    def _pearson_p_values(coefs: np.ndarray, n: Union[int, np.ndarray]) -> np.ndarray:
+        """
+        Vectorized version of _pearson_p_value. The two-sided t-test p-value
+        2 * t.sf(|t|, dof) with t = r * sqrt(dof / (1 - r²)) is exactly the
+        regularized incomplete beta I(dof/2, 1/2, 1 - r²): a single ufunc call,
+        without the t statistic or the scipy.stats distribution object.
+        """
+        coefs = np.asarray(coefs, dtype=np.float64)
+        dof = np.asarray(n, dtype=np.float64) - 2
+        with np.errstate(invalid='ignore'):
+            p_values = special.betainc(0.5 * dof, 0.5, np.clip(1.0 - coefs * coefs, 0.0, 1.0))
+        return np.where(dof <= 0, 1.0, p_values)
+
     def find_correlations(self, 
                          datasets: List[pd.DataFrame], 
                          method: str = 'pearson',
-                         threshold: float = 0.7) -> List[Dict]:
+                         threshold: float = 0.7,
+                         as_array: bool = False,
+                         precision: str = 'f64') -> Union[List[Dict], np.ndarray]:
         """
         Find all significant correlations between datasets.
         
@@ -325,81 +500,270 @@ class CorrelationEngine:
             datasets: List of DataFrames to analyze
             method: Correlation method ('pearson', 'spearman', or 'kendall')
             threshold: Minimum correlation threshold
+            as_array: Return a structured array of CORRELATION_DTYPE instead of dicts
+            precision: 'f32' to correlate complete data in single precision (half the
+                memory traffic; pairs with |r| close to 1 are recomputed in 'f64')
             
         Returns:
             List of significant correlations
         """
         if method not in self.correlation_methods:
             raise ValueError(f"Method {method} not supported. Use: {list(self.correlation_methods)}")
+        if precision not in ('f32', 'f64'):
+            raise ValueError(f"Precision {precision} not supported. Use: ['f32', 'f64']")
             
         logger.info(f"Starting correlation analysis with {method} method")
-        results = []
-        
-        for i, df1 in enumerate(datasets):
-            for j, df2 in enumerate(datasets[i+1:], i+1):
-                for col1 in df1.columns:
-                    for col2 in df2.columns:
-                        try:
-                            result = self.analyzer.analyze_pair(
-                                df1[col1],
-                                df2[col2],
-                                col1,
-                                col2,
-                                method=method,
-                                dataset1_index=i,
-                                dataset2_index=j
-                            )
-                            
-                            if result is not None and abs(result.correlation_coefficient) >= threshold:
-                                results.append(result.to_dict())
-                                
-                        except Exception as e:
-                            logger.warning(f"Error calculating correlation between {col1} and {col2}: {str(e)}")
-                            
+        
+        # Align every column of every dataset in a single (rows x columns) matrix
+        frames = [df.apply(pd.to_numeric, errors='coerce') for df in datasets]
+        widths = [len(df.columns) for df in frames]
+        if len(frames) < 2 or sum(widths) < 2:
+            return np.empty(0, dtype=CORRELATION_DTYPE) if as_array else []
+        X = pd.concat(frames, axis=1).to_numpy(dtype=np.float64)
+        dataset_of = np.repeat(np.arange(len(frames)), widths)
+        column_of = np.concatenate([np.arange(width) for width in widths])
+        
+        # Only pairs of columns belonging to different datasets are compared: the
+        # columns of each dataset against those of the datasets after it (one
+        # rectangular block per dataset, row-major upper triangle order overall)
+        bounds = np.concatenate(([0], np.cumsum(widths))).tolist()
+        blocks = [(slice(bounds[d], bounds[d + 1]), slice(bounds[d + 1], bounds[-1]))
+                  for d in range(len(frames) - 1)]
+        
+        if method in ('pearson', 'spearman') and not np.isnan(X).any():
+            idx_a, idx_b, coefs, p_values = self._find_correlations_bulk(X, blocks, method, threshold, precision)
+        elif method == 'pearson':
+            idx_a, idx_b, coefs, p_values = self._find_correlations_masked(X, blocks, threshold)
+        else:
+            idx_a, idx_b, coefs, p_values = self._find_correlations_pairwise(X, blocks, method, threshold)
+        
+        results = np.empty(len(coefs), dtype=CORRELATION_DTYPE)
+        results['dataset1_index'] = dataset_of[idx_a]
+        results['column1_index'] = column_of[idx_a]
+        results['dataset2_index'] = dataset_of[idx_b]
+        results['column2_index'] = column_of[idx_b]
+        results['correlation'] = coefs
+        results['p_value'] = p_values
+        
         logger.info(f"Analysis completed. {len(results)} correlations found.")
-        return results
+        if as_array:
+            return results
+        
+        return [
+            CorrelationResult(
+                series1_name=frames[d1].columns[c1],
+                series2_name=frames[d2].columns[c2],
+                correlation_coefficient=coef,
+                p_value=p_val,
+                dataset1_index=d1,
+                dataset2_index=d2
+            ).to_dict()
+            for d1, c1, d2, c2, coef, p_val in results.tolist()
+        ]
+
+    def _find_correlations_bulk(self,
+                                X: np.ndarray,
+                                blocks: PairBlocks,
+                                method: str,
+                                threshold: float,
+                                precision: str = 'f64') -> PairArrays:
+        """
+        Correlate all columns at once: Pearson is the dot product of centered,
+        L2-normalized columns, so the whole matrix is a single matmul (Spearman: on ranks).
+        """
+        if method == 'spearman':
+            from scipy.stats import rankdata
+            X = rankdata(X, axis=0)
+        
+        # Center into a single buffer (means in double precision, cast on store),
+        # column norms without a squared temporary, then normalize in place
+        dtype = np.float32 if precision == 'f32' else np.float64
+        Xn = np.empty(X.shape, dtype=dtype)
+        np.subtract(X, X.mean(axis=0), out=Xn, casting='same_kind')
+        norms = np.sqrt(np.einsum('ij,ij->j', Xn, Xn))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Xn *= 1.0 / norms
+        C = Xn.T @ Xn
+        
+        # Only the pairs above the threshold need a p-value, computed in one batch
+        idx_a, idx_b = self._select_pairs(blocks, lambda rows, cols: np.abs(C[rows, cols]) >= threshold)
+        coefs = np.clip(C[idx_a, idx_b].astype(np.float64), -1.0, 1.0)
+        
+        # Near |r| = 1 single precision loses the digits the p-value depends on
+        if dtype is np.float32:
+            for k in np.flatnonzero(np.abs(coefs) >= 0.99):
+                coefs[k], _ = self._pearson_from_prepared(self._prepare(X[:, idx_a[k]]),
+                                                          self._prepare(X[:, idx_b[k]]),
+                                                          X.shape[0])
+        
+        p_values = self._pearson_p_values(coefs, X.shape[0])
+        return idx_a, idx_b, coefs, p_values
+
+    def _find_correlations_masked(self,
+                                  X: np.ndarray,
+                                  blocks: PairBlocks,
+                                  threshold: float) -> PairArrays:
+        """
+        Pearson on pairwise-complete rows for all pairs at once. The sums needed
+        by each pair (count, sum, sum of squares, cross products over the rows
+        valid in both columns) are matrix products of the zero-filled data and
+        the validity mask.
+        """
+        valid = ~np.isnan(X)
+        W = valid.astype(np.float64)
+        # Shifting each column by its mean does not change the correlation
+        # but keeps the sums of squares small (less cancellation)
+        Z = np.where(valid, X - np.nanmean(X, axis=0), 0.0)
+        
+        counts = W.T @ W
+        sums = Z.T @ W              # sums[a, b]: sum of column a over rows valid in b
+        squares = (Z * Z).T @ W
+        cross = Z.T @ Z
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = cross - sums * sums.T / counts
+            var = squares - sums * sums / counts
+            C = cov / np.sqrt(var * var.T)
+        
+        idx_a, idx_b = self._select_pairs(
+            blocks, lambda rows, cols: (counts[rows, cols] >= 2) & (np.abs(C[rows, cols]) >= threshold)
+        )
+        coefs = np.clip(C[idx_a, idx_b], -1.0, 1.0)
+        p_values = self._pearson_p_values(coefs, counts[idx_a, idx_b])
+        return idx_a, idx_b, coefs, p_values
+
+    def _find_correlations_pairwise(self,
+                                    X: np.ndarray,
+                                    blocks: PairBlocks,
+                                    method: str,
+                                    threshold: float) -> PairArrays:
+        """
+        Correlate column pairs one by one, ignoring the rows missing in either column.
+        Large workloads are split into many small chunks spread over worker processes
+        (the per-pair work is Python-bound, threads would not run it in parallel).
+        """
+        # Every pair of each block, enumerated row by row
+        pairs_a = np.concatenate([np.repeat(np.arange(rows.start, rows.stop), cols.stop - cols.start)
+                                  for rows, cols in blocks])
+        pairs_b = np.concatenate([np.tile(np.arange(cols.start, cols.stop), rows.stop - rows.start)
+                                  for rows, cols in blocks])
+        n_workers = min(PERFORMANCE_CONFIG['max_workers'], available_cpus(), len(pairs_a) // PARALLEL_MIN_PAIRS)
+        
+        if n_workers <= 1:
+            found = self._correlate_pairs(X, pairs_a, pairs_b, method, threshold)
+        else:
+            # Several chunks per worker so that faster workers pick up the remaining ones
+            chunks = np.array_split(np.arange(len(pairs_a)), n_workers * 8)
+            with ProcessPoolExecutor(max_workers=n_workers,
+                                     mp_context=pairwise_mp_context(),
+                                     initializer=_init_pairwise_worker,
+                                     initargs=(X, method, threshold)) as executor:
+                found = [pair
+                         for chunk_found in executor.map(_correlate_pairs_in_worker,
+                                                         [pairs_a[chunk] for chunk in chunks],
+                                                         [pairs_b[chunk] for chunk in chunks])
+                         for pair in chunk_found]
+        
+        idx_a, idx_b, coefs, p_values = zip(*found) if found else ((), (), (), ())
+        return (np.array(idx_a, dtype=np.intp), np.array(idx_b, dtype=np.intp),
+                np.array(coefs, dtype=np.float64), np.array(p_values, dtype=np.float64))
+
+    @staticmethod
+    def _select_pairs(blocks: PairBlocks, keep) -> Tuple[np.ndarray, np.ndarray]:
+        """Column indices (a, b) of the pairs of each block where keep(rows, cols) is True."""
+        selected_a, selected_b = [], []
+        for rows, cols in blocks:
+            a, b = np.nonzero(keep(rows, cols))
+            selected_a.append(a + rows.start)
+            selected_b.append(b + cols.start)
+        return np.concatenate(selected_a), np.concatenate(selected_b)
+
+    @staticmethod
+    def _correlate_pairs(X: np.ndarray,
+                         pairs_a: np.ndarray,
+                         pairs_b: np.ndarray,
+                         method: str,
+                         threshold: float) -> List[Tuple[int, int, float, float]]:
+        """Correlate the given column pairs of X; return those above the threshold."""
+        from scipy.stats import rankdata
+        
+        found = []
+        valid = ~np.isnan(X)
+        
+        # Columns without missing values are centered and normalized once, not once per pair
+        prepared = {}
+        def prepared_column(index):
+            if index not in prepared:
+                column = X[:, index]
+                prepared[index] = CorrelationEngine._prepare(rankdata(column) if method == 'spearman' else column)
+            return prepared[index]
+        
+        for a, b in zip(pairs_a.tolist(), pairs_b.tolist()):
+            rows = valid[:, a] & valid[:, b]
+            if rows.sum() < 2:
+                continue
+            try:
+                if method != 'kendall' and rows.all():
+                    coef, p_val = CorrelationEngine._pearson_from_prepared(prepared_column(a), prepared_column(b), len(rows))
+                else:
+                    coef, p_val = CorrelationEngine._correlate(X[rows, a], X[rows, b], method)
+            except Exception as e:
+                logger.warning(f"Error calculating correlation between columns {a} and {b}: {str(e)}")
+                continue
+            if abs(coef) >= threshold:
+                found.append((a, b, coef, p_val))
+        return found
 
     def filter_significant_correlations(self, 
-                                      correlations: List[Dict],
-                                      p_value_threshold: float = 0.05) -> List[Dict]:
+                                      correlations: Union[List[Dict], np.ndarray],
+                                      p_value_threshold: float = 0.05) -> Union[List[Dict], np.ndarray]:
         """
         Filter statistically significant correlations.
         
         Args:
-            correlations: List of correlations to filter
+            correlations: List of correlations (or CORRELATION_DTYPE array) to filter
             p_value_threshold: Significance threshold
             
         Returns:
             List of significant correlations
         """
-        significant_correlations = [
-            corr for corr in correlations 
-            if corr['p_value'] < p_value_threshold
-        ]
+        if isinstance(correlations, np.ndarray):
+            significant_correlations = correlations[correlations['p_value'] < p_value_threshold]
+        else:
+            significant_correlations = [
+                corr for corr in correlations 
+                if corr['p_value'] < p_value_threshold
+            ]
         
         logger.info(f"Filtering performed: {len(significant_correlations)}/{len(correlations)} significant correlations")
         return significant_correlations
 
-    def get_correlation_summary(self, correlations: List[Dict]) -> Dict:
+    def get_correlation_summary(self, correlations: Union[List[Dict], np.ndarray]) -> Dict:
         """
         Generate summary of found correlations.
         
         Args:
-            correlations: List of correlations
+            correlations: List of correlations (or CORRELATION_DTYPE array)
             
         Returns:
             Dictionary containing correlation statistics
         """
-        if not correlations:
+        if len(correlations) == 0:
             return {"message": "No correlation found"}
-            
-        corr_values = [abs(c['correlation']) for c in correlations]
+        
+        # Single pass over the dicts into a float64 buffer, then numpy reductions
+        count = len(correlations)
+        if isinstance(correlations, np.ndarray):
+            corr_values = np.abs(correlations['correlation'])
+        else:
+            corr_values = np.abs(np.fromiter((c['correlation'] for c in correlations),
+                                             dtype=np.float64, count=count))
         return {
-            "total_count": len(correlations),
-            "average_correlation": np.mean(corr_values),
-            "max_correlation": np.max(corr_values),
-            "min_correlation": np.min(corr_values),
-            "standard_deviation": np.std(corr_values),
+            "nombre_total": count,
+            "correlation_moyenne": float(corr_values.mean()),
+            "correlation_max": float(corr_values.max()),
+            "correlation_min": float(corr_values.min()),
+            "ecart_type": float(corr_values.std()),
             "timestamp": datetime.now().isoformat()
         }
 
@@ -1,8 +1,9 @@
 """
 Services pour l'application Chartastrophe.
 Contient les services de traduction et autres utilitaires.
-"""
 
-from .translation_service import translation_service
+Le service de traduction s'importe depuis son module, où l'instance globale
+est créée au premier accès :
 
-__all__ = ['translation_service'] 
\ No newline at end of file
+    from src.services.translation_service import translation_service
+""" 
\ No newline at end of file
@@ -6,11 +6,114 @@ Charge les traductions depuis un fichier JSON généré une seule fois avec Deep
 import logging
 import json
 import os
+import re
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Nombre maximal de traductions conservées dans chaque cache LRU
+_CACHE_MAX_SIZE = 8192
+
+# Corrections spécifiques communes des traductions (appliquées en minuscules)
+_CORRECTIONS: Dict[str, str] = {
+    'statistiques de naissance': 'statistiques de naissances',
+    'données de naissances': 'données de naissance',
+    'informatique quantique papiers': 'articles d\'informatique quantique',
+    'marché du pétrole rapport': 'rapport du marché pétrolier',
+    'transport de qualité': 'qualité des transports',
+    'qualité air': 'qualité de l\'air',
+    'air quality transport': 'qualité des transports',
+    'environmental indicators': 'indicateurs environnementaux',
+    'environmental indicators growth': 'croissance des indicateurs environnementaux',
+    'transport quality': 'qualité des transports',
+    'air transport': 'transport aérien',
+    'growth': 'croissance',
+    'trends': 'tendances',
+    'patterns': 'modèles',
+    'statistics': 'statistiques',
+    'levels': 'niveaux',
+    'measurements': 'mesures',
+    'usage': 'utilisation',
+    'activity': 'activité',
+    'changes': 'changements'
+}
+
+# Alternance triée par longueur décroissante : l'expression la plus longue l'emporte
+_CORRECTIONS_PATTERN = re.compile(
+    '|'.join(re.escape(wrong) for wrong in sorted(_CORRECTIONS, key=len, reverse=True))
+)
+
+# Mots anglais résiduels courants et leur traduction (formes singulier/pluriel)
+_ENGLISH_WORD_TRANSLATIONS: Dict[str, str] = {
+    'environmental': 'environnemental',
+    'indicator': 'indicateurs',
+    'indicators': 'indicateurs',
+    'growth': 'croissance',
+    'trend': 'tendances',
+    'trends': 'tendances',
+    'pattern': 'modèles',
+    'patterns': 'modèles',
+    'statistic': 'statistiques',
+    'statistics': 'statistiques',
+    'level': 'niveaux',
+    'levels': 'niveaux',
+    'measurement': 'mesures',
+    'measurements': 'mesures',
+    'usage': 'utilisation',
+    'activity': 'activité',
+    'change': 'changements',
+    'changes': 'changements',
+    'analysis': 'analyse',
+    'report': 'rapport',
+    'market': 'marché',
+    'data': 'données',
+    'quality': 'qualité',
+    'transport': 'transport',
+    'energy': 'énergie',
+    'health': 'santé',
+    'technology': 'technologie'
+}
+
+# Une seule alternance compilée au chargement : un seul parcours du texte par appel
+_ENGLISH_WORD_PATTERN = re.compile(
+    r'\b(' + '|'.join(re.escape(word) for word in _ENGLISH_WORD_TRANSLATIONS) + r')\b',
+    re.IGNORECASE
+)
+
+# Corrections courantes appliquées aux traductions pré-générées
+COMMON_FIXES: Dict[str, str] = {
+    'Transport de qualité': 'Qualité des transports',
+    'transport de qualité': 'qualité des transports',
+    'AIr Quality Transport': 'Qualité des transports',
+    'Air Quality Transport': 'Qualité des transports'
+}
+
+def apply_common_fixes(translation: str) -> str:
+    """Applique les corrections courantes à une traduction pré-générée."""
+    for wrong, correct in COMMON_FIXES.items():
+        if wrong in translation:
+            translation = translation.replace(wrong, correct)
+    return translation
+
+# Taille du filtre de trigrammes (filtre de Bloom à une fonction de hachage)
+_TRIGRAM_FILTER_SIZE = 1 << 16
+
+# Nettoyage des noms de datasets : précisions entre parenthèses et suffixes redondants
+_PARENTHESES_PATTERN = re.compile(r'\s*\([^)]*\)\s*')
+_REDUNDANT_SUFFIX_PATTERN = re.compile(
+    r'\s+(data|statistics|trends|analysis|measurements|levels)$',
+    re.IGNORECASE
+)
+
 class TranslationService:
     """Service de traduction utilisant des traductions pré-générées."""
     
@@ -18,13 +121,27 @@ class TranslationService:
         """Initialise le service de traduction."""
         self.pretranslated_datasets: Dict[str, str] = {}
         self.fallback_translations: Dict[str, str] = {}
-        self.cache: Dict[str, str] = {}
         
-        # Charger les traductions pré-générées
-        self._load_pretranslated_datasets()
+        # Mots-clés pré-calculés de chaque entrée : (mots, nombre de mots, nom anglais)
+        self._entry_wordsets: List[Tuple[FrozenSet[str], int, str]] = []
+        
+        # Noms anglais en minuscules, dans l'ordre du fichier : (minuscules, nom anglais)
+        self._pretranslated_keys_lower: List[Tuple[str, str]] = []
         
-        # Appliquer les corrections communes automatiquement
-        self.fix_common_issues()
+        # Trigrammes des noms anglais en minuscules, pour écarter les recherches partielles vaines
+        self._trigram_filter = bytearray(_TRIGRAM_FILTER_SIZE)
+        self._trigram_filter_enabled = False
+        
+        # Caches LRU bornés, propres à l'instance
+        self._translate_text_cached = lru_cache(maxsize=_CACHE_MAX_SIZE)(self._translate_text_uncached)
+        self._translate_dataset_name_cached = lru_cache(maxsize=_CACHE_MAX_SIZE)(
+            self._translate_dataset_name_uncached
+        )
+        
+        # Les traductions pré-générées sont chargées à la première utilisation
+        self._loaded = False
+        self._pretranslated_normalized = False
+        self._load_lock = threading.Lock()
         
         # Fallback : dictionnaire de traductions pour les termes de base
         self.fallback_translations = {
@@ -68,13 +185,46 @@ class TranslationService:
             'employment rates': 'taux d\'emploi',
             'housing prices': 'prix de l\'immobilier',
             'energy consumption': 'consommation d\'énergie',
-            'air quality': 'qualité de l\'air',
             'water resources': 'ressources en eau',
             'food security': 'sécurité alimentaire',
             'digital transformation': 'transformation numérique',
             'innovation metrics': 'métriques d\'innovation',
             'productivity levels': 'niveaux de productivité'
         }
+        
+        # Clés internées : les recherches se résument à des comparaisons de pointeurs
+        self.fallback_translations = {
+            sys.intern(english): french for english, french in self.fallback_translations.items()
+        }
+        
+        # Variantes avec majuscule initiale, pour les textes commençant par une majuscule
+        self._fallback_capitalized = {
+            english: french.capitalize() for english, french in self.fallback_translations.items()
+        }
+        
+        # Alternance de tous les termes : un seul parcours pour savoir si un terme est présent
+        # (à reconstruire, comme les variantes, si fallback_translations est modifié)
+        self._fallback_terms_pattern = re.compile(
+            '|'.join(re.escape(english) for english in self.fallback_translations)
+        )
+    
+    def _ensure_loaded(self):
+        """Charge les traductions pré-générées et applique les corrections au premier appel."""
+        if self._loaded:
+            return
+        
+        with self._load_lock:
+            if self._loaded:
+                return
+            
+            self._load_pretranslated_datasets()
+            
+            # Appliquer les corrections communes, sauf si le fichier est déjà normalisé
+            # (voir scripts/normalize_pretranslated.py)
+            if not self._pretranslated_normalized:
+                self.fix_common_issues()
+            
+            self._loaded = True
     
     def _load_pretranslated_datasets(self):
         """Charge les traductions pré-générées depuis le fichier JSON."""
@@ -82,11 +232,20 @@ class TranslationService:
         
         if pretranslated_file.exists():
             try:
-                with open(pretranslated_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                # orjson (implémentation C) si disponible, sinon json standard
+                if orjson is not None:
+                    with open(pretranslated_file, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(pretranslated_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
                 
-                self.pretranslated_datasets = data.get('translations', {})
+                self.pretranslated_datasets = {
+                    sys.intern(english): french for english, french in data.get('translations', {}).items()
+                }
                 metadata = data.get('metadata', {})
+                # Drapeau posé par les scripts de normalisation, retiré par ceux qui modifient des entrées
+                self._pretranslated_normalized = metadata.get('normalized') is True
                 
                 logger.info(f"✅ Traductions pré-générées chargées: {len(self.pretranslated_datasets)} entrées")
                 logger.info(f"📅 Générées le: {metadata.get('generated_at', 'inconnu')}")
@@ -95,10 +254,44 @@ class TranslationService:
             except Exception as e:
                 logger.warning(f"⚠️ Erreur lors du chargement des traductions pré-générées: {e}")
                 self.pretranslated_datasets = {}
+                self._pretranslated_normalized = False
         else:
             logger.info("📝 Aucun fichier de traductions pré-générées trouvé")
             logger.info(f"💡 Générez-le avec: python scripts/pretranslate_datasets.py")
             self.pretranslated_datasets = {}
+            self._pretranslated_normalized = False
+        
+        self._index_pretranslated_datasets()
+    
+    def _index_pretranslated_datasets(self):
+        """Pré-calcule les noms en minuscules et les mots-clés utilisés par les recherches partielles."""
+        self._entry_wordsets = []
+        self._pretranslated_keys_lower = []
+        for english_name in self.pretranslated_datasets:
+            english_lower = english_name.lower()
+            self._pretranslated_keys_lower.append((english_lower, english_name))
+            
+            english_words = english_lower.replace('-', ' ').replace('_', ' ').split()
+            self._entry_wordsets.append((frozenset(english_words), len(english_words), english_name))
+        
+        # Un nom de moins de 3 caractères n'a pas de trigramme : le filtre ne peut pas l'exclure
+        self._trigram_filter = bytearray(_TRIGRAM_FILTER_SIZE)
+        self._trigram_filter_enabled = all(len(english_name) >= 3 for english_name in self.pretranslated_datasets)
+        if self._trigram_filter_enabled:
+            for english_lower, _ in self._pretranslated_keys_lower:
+                for i in range(len(english_lower) - 2):
+                    self._trigram_filter[hash(english_lower[i:i + 3]) % _TRIGRAM_FILTER_SIZE] = 1
+    
+    def _may_match_partially(self, text_lower: str) -> bool:
+        """Indique si le texte partage au moins un trigramme avec un nom pré-traduit."""
+        if not self._trigram_filter_enabled or len(text_lower) < 3:
+            return True
+        
+        trigram_filter = self._trigram_filter
+        return any(
+            trigram_filter[hash(text_lower[i:i + 3]) % _TRIGRAM_FILTER_SIZE]
+            for i in range(len(text_lower) - 2)
+        )
     
     def translate_text(self, text: str, target_lang: str = 'fr') -> str:
         """
@@ -116,25 +309,54 @@ class TranslationService:
         if target_lang == 'en' or not text.strip():
             return text
         
-        # Nettoyage du texte
-        text = text.strip()
+        # Sans aucune lettre (nombres, codes...), rien à traduire
+        if not any(c.isalpha() for c in text):
+            return text.strip()
+        
+        self._ensure_loaded()
         
-        # Vérification du cache
-        cache_key = f"{text.lower()}_{target_lang}"
-        if cache_key in self.cache:
-            logger.debug(f"📁 Traduction trouvée dans le cache: {text[:50]}...")
-            return self.cache[cache_key]
+        # Nettoyage du texte puis recherche via le cache
+        return self._translate_text_cached(text.strip(), target_lang)
+    
+    def translate_batch(self, texts: List[str], target_lang: str = 'fr') -> List[str]:
+        """
+        Traduit une liste de textes en une seule passe.
+        
+        Chaque texte distinct n'est traduit qu'une fois, les doublons
+        réutilisent le même résultat.
+        
+        Args:
+            texts: Textes à traduire (en anglais)
+            target_lang: Langue cible ('fr' pour français, 'en' pour anglais)
+            
+        Returns:
+            Textes traduits, dans le même ordre que l'entrée
+        """
+        if target_lang == 'en':
+            return list(texts)
+        
+        translations: Dict[str, str] = {}
+        for text in texts:
+            if text not in translations:
+                translations[text] = self.translate_text(text, target_lang)
+        
+        return [translations[text] for text in texts]
+    
+    def _translate_text_uncached(self, text: str, target_lang: str) -> str:
+        """Enchaîne les recherches de traduction (résultat mis en cache par translate_text)."""
+        # Minuscules calculées une seule fois pour toutes les recherches
+        text_lower = text.lower()
         
         # 1. Recherche dans les traductions pré-générées (exacte)
         translated = self._get_pretranslated(text)
         
         # 2. Si pas trouvé, recherche partielle dans les pré-générées
         if not translated:
-            translated = self._get_pretranslated_partial(text)
+            translated = self._get_pretranslated_partial(text, text_lower)
         
         # 3. Si toujours pas trouvé, utiliser le dictionnaire de fallback
         if not translated:
-            translated = self._translate_with_fallback(text, target_lang)
+            translated = self._translate_with_fallback(text, target_lang, text_lower)
         
         # 4. Si aucune traduction disponible, retourner le texte original
         # AUCUN appel DeepL en temps réel - utilisation UNIQUEMENT des pré-traduites
@@ -142,9 +364,6 @@ class TranslationService:
             translated = text
             logger.debug(f"⚠️ Pas de traduction pré-générée pour: {text[:50]}... - retour du texte original")
         
-        # Mise en cache de la traduction
-        self.cache[cache_key] = translated
-        
         return translated
     
     def _get_pretranslated(self, text: str) -> Optional[str]:
@@ -155,34 +374,40 @@ class TranslationService:
             return result
         return None
     
-    def _get_pretranslated_partial(self, text: str) -> Optional[str]:
+    def _get_pretranslated_partial(self, text: str, text_lower: str) -> Optional[str]:
         """Recherche partielle dans les traductions pré-générées."""
-        text_lower = text.lower()
+        # Sans trigramme commun, aucun nom ne peut contenir le texte ni y être contenu
+        if not self._may_match_partially(text_lower):
+            return None
         
         # Chercher des correspondances partielles
-        for english_text, french_text in self.pretranslated_datasets.items():
-            if english_text.lower() in text_lower or text_lower in english_text.lower():
+        for english_lower, english_text in self._pretranslated_keys_lower:
+            if english_lower in text_lower or text_lower in english_lower:
+                french_text = self.pretranslated_datasets[english_text]
                 # Si on trouve une correspondance partielle, l'utiliser comme base
                 logger.debug(f"🔍 Pré-traduit (partiel): '{text[:30]}...' → '{french_text[:30]}...'")
                 return french_text
         
         return None
     
-    def _translate_with_fallback(self, text: str, target_lang: str) -> Optional[str]:
+    def _translate_with_fallback(self, text: str, target_lang: str, text_lower: str) -> Optional[str]:
         """Traduit en utilisant le dictionnaire de fallback."""
         if target_lang != 'fr':
             return None
         
-        text_lower = text.lower()
-        
         # Recherche exacte d'abord
         if text_lower in self.fallback_translations:
-            result = self.fallback_translations[text_lower]
             if text[0].isupper():
-                result = result.capitalize()
+                result = self._fallback_capitalized[text_lower]
+            else:
+                result = self.fallback_translations[text_lower]
             logger.debug(f"📚 Fallback: '{text}' → '{result}'")
             return result
         
+        # Aucun terme connu dans le texte : inutile de parcourir le dictionnaire
+        if not self._fallback_terms_pattern.search(text_lower):
+            return None
+        
         # Recherche partielle pour des expressions complexes
         for english_term, french_term in self.fallback_translations.items():
             if english_term in text_lower:
@@ -209,17 +434,18 @@ class TranslationService:
             logger.debug(f"🇺🇸 Langue anglaise demandée, retour du nom original: '{name}'")
             return name
         
-        # Vérification du cache d'abord
-        cache_key = f"{name.lower()}_{target_lang}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        self._ensure_loaded()
         
+        # Vérification du cache d'abord
+        return self._translate_dataset_name_cached(name, target_lang)
+    
+    def _translate_dataset_name_uncached(self, name: str, target_lang: str) -> str:
+        """Recherche la traduction d'un nom de dataset (résultat mis en cache par translate_dataset_name)."""
         # 1. Recherche EXACTE dans les traductions pré-générées
         if name in self.pretranslated_datasets:
             translated = self.pretranslated_datasets[name]
             # Post-traitement léger pour améliorer la qualité
             translated = self._post_process_translation(translated)
-            self.cache[cache_key] = translated
             logger.debug(f"✅ Pré-traduit: '{name[:40]}...' → '{translated[:40]}...'")
             return translated
         
@@ -227,13 +453,11 @@ class TranslationService:
         translated = self._find_similar_pretranslated(name)
         if translated:
             translated = self._post_process_translation(translated)
-            self.cache[cache_key] = translated
             logger.debug(f"🔍 Similarité trouvée: '{name[:40]}...' → '{translated[:40]}...'")
             return translated
         
         # 3. Si aucune traduction pré-générée, retourner le nom original
         logger.debug(f"⚠️ Pas de traduction pré-générée pour: '{name}'")
-        self.cache[cache_key] = name
         return name
     
     def _find_similar_pretranslated(self, name: str) -> Optional[str]:
@@ -243,140 +467,93 @@ class TranslationService:
         # Mots-clés importants à rechercher
         keywords = name_lower.replace('-', ' ').replace('_', ' ').split()
         
+        query_words = frozenset(keywords)
+        query_length = len(keywords)
+        
         best_match = None
         best_score = 0
         
-        for english_name, french_translation in self.pretranslated_datasets.items():
-            english_lower = english_name.lower()
-            
+        for english_words, english_length, english_name in self._entry_wordsets:
             # Compter les mots-clés communs
-            english_words = english_lower.replace('-', ' ').replace('_', ' ').split()
-            common_words = set(keywords) & set(english_words)
+            common_words = query_words & english_words
             
             if common_words:
-                score = len(common_words) / max(len(keywords), len(english_words))
+                score = len(common_words) / max(query_length, english_length)
                 if score > best_score and score > 0.3:  # Au moins 30% de similarité
                     best_score = score
-                    best_match = french_translation
+                    best_match = english_name
+        
+        # La traduction est lue à la fin pour tenir compte des corrections appliquées
+        if best_match is not None:
+            return self.pretranslated_datasets[best_match]
         
-        return best_match
+        return None
     
     def _clean_dataset_name_for_translation(self, name: str) -> str:
         """Nettoie le nom de dataset avant traduction."""
-        import re
-        
         # Supprimer les informations de pays/région qui peuvent confuser
-        cleaned = re.sub(r'\s*\([^)]*\)\s*', '', name)
+        cleaned = _PARENTHESES_PATTERN.sub('', name)
         
         # Supprimer les suffixes redondants
-        cleaned = re.sub(r'\s+(data|statistics|trends|analysis|measurements|levels)$', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _REDUNDANT_SUFFIX_PATTERN.sub('', cleaned)
         
         return cleaned.strip()
     
     def _post_process_translation(self, translated: str) -> str:
         """Post-traite la traduction pour améliorer la qualité."""
-        # Corrections spécifiques communes
-        corrections = {
-            'statistiques de naissance': 'statistiques de naissances',
-            'données de naissances': 'données de naissance',
-            'informatique quantique papiers': 'articles d\'informatique quantique',
-            'marché du pétrole rapport': 'rapport du marché pétrolier',
-            'transport de qualité': 'qualité des transports',
-            'qualité air': 'qualité de l\'air',
-            'air quality transport': 'qualité des transports',
-            'environmental indicators': 'indicateurs environnementaux',
-            'environmental indicators growth': 'croissance des indicateurs environnementaux',
-            'transport quality': 'qualité des transports',
-            'air transport': 'transport aérien',
-            'growth': 'croissance',
-            'trends': 'tendances',
-            'patterns': 'modèles',
-            'statistics': 'statistiques',
-            'levels': 'niveaux',
-            'measurements': 'mesures',
-            'usage': 'utilisation',
-            'activity': 'activité',
-            'changes': 'changements'
-        }
-        
         result = translated.lower()
         
-        # Appliquer les corrections
-        for wrong, correct in corrections.items():
-            if wrong in result:
-                result = result.replace(wrong, correct)
+        # Appliquer les corrections en un seul parcours
+        result = _CORRECTIONS_PATTERN.sub(lambda match: _CORRECTIONS[match.group(0)], result)
         
         # Remettre la première lettre en majuscule
         if result:
             result = result[0].upper() + result[1:]
         
-        # Corrections spécifiques pour des patterns problématiques
-        import re
-        
         # Corriger les mots anglais résiduels courants
-        english_patterns = {
-            r'\benvironmental\b': 'environnemental',
-            r'\bindicators?\b': 'indicateurs',
-            r'\bgrowth\b': 'croissance',
-            r'\btrends?\b': 'tendances',
-            r'\bpatterns?\b': 'modèles',
-            r'\bstatistics?\b': 'statistiques',
-            r'\blevels?\b': 'niveaux',
-            r'\bmeasurements?\b': 'mesures',
-            r'\busage\b': 'utilisation',
-            r'\bactivity\b': 'activité',
-            r'\bchanges?\b': 'changements',
-            r'\banalysis\b': 'analyse',
-            r'\breport\b': 'rapport',
-            r'\bmarket\b': 'marché',
-            r'\bdata\b': 'données',
-            r'\bquality\b': 'qualité',
-            r'\btransport\b': 'transport',
-            r'\benergy\b': 'énergie',
-            r'\bhealth\b': 'santé',
-            r'\btechnology\b': 'technologie'
-        }
-        
-        for pattern, replacement in english_patterns.items():
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+        result = _ENGLISH_WORD_PATTERN.sub(
+            lambda match: _ENGLISH_WORD_TRANSLATIONS[match.group(1).lower()],
+            result
+        )
         
         return result
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques d'utilisation du service."""
+        self._ensure_loaded()
+        
         return {
             'pretranslated_entries': len(self.pretranslated_datasets),
             'fallback_entries': len(self.fallback_translations),
-            'cache_entries': len(self.cache),
+            'cache_entries': (self._translate_text_cached.cache_info().currsize
+                              + self._translate_dataset_name_cached.cache_info().currsize),
             'pretranslated_file_exists': Path("data/pretranslated_datasets.json").exists(),
             'mode': 'pretranslated' if self.pretranslated_datasets else 'fallback_only'
         }
     
     def reload_pretranslated(self):
         """Recharge les traductions pré-générées depuis le fichier."""
-        self._load_pretranslated_datasets()
-        self.cache.clear()  # Vider le cache pour forcer le rechargement
+        with self._load_lock:
+            self._load_pretranslated_datasets()
+            self._loaded = True
+        self.clear_cache()  # Vider le cache pour forcer le rechargement
         logger.info("🔄 Traductions pré-générées rechargées")
     
+    def clear_cache(self):
+        """Vide les caches de traduction."""
+        self._translate_text_cached.cache_clear()
+        self._translate_dataset_name_cached.cache_clear()
+    
     def fix_common_issues(self):
         """Corrige les problèmes courants dans les traductions existantes."""
         if not self.pretranslated_datasets:
             return
         
         fixes_applied = 0
-        common_fixes = {
-            'Transport de qualité': 'Qualité des transports',
-            'transport de qualité': 'qualité des transports',
-            'AIr Quality Transport': 'Qualité des transports',
-            'Air Quality Transport': 'Qualité des transports'
-        }
         
         # Corriger les traductions dans le dictionnaire pré-généré
         for english, french in list(self.pretranslated_datasets.items()):
-            corrected = french
-            for wrong, correct in common_fixes.items():
-                if wrong in corrected:
-                    corrected = corrected.replace(wrong, correct)
+            corrected = apply_common_fixes(french)
             
             if corrected != french:
                 self.pretranslated_datasets[english] = corrected
@@ -384,12 +561,24 @@ class TranslationService:
                 logger.info(f"🔧 Correction appliquée: '{french}' → '{corrected}'")
         
         # Vider le cache pour appliquer les corrections
-        self.cache.clear()
+        self.clear_cache()
         
         if fixes_applied > 0:
             logger.info(f"✅ {fixes_applied} corrections appliquées automatiquement")
         else:
             logger.info("✅ Aucune correction nécessaire")
 
-# Instance globale du service de traduction
-translation_service = TranslationService() 
\ No newline at end of file
+# Instance globale du service de traduction, créée au premier accès
+_translation_service: Optional[TranslationService] = None
+_translation_service_lock = threading.Lock()
+
+def __getattr__(name: str) -> Any:
+    """Crée l'instance globale `translation_service` à la demande (PEP 562)."""
+    global _translation_service
+    if name == 'translation_service':
+        if _translation_service is None:
+            with _translation_service_lock:
+                if _translation_service is None:
+                    _translation_service = TranslationService()
+        return _translation_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -2,22 +2,53 @@
 Flask web interface application.
 """
 from flask import Flask, Blueprint
+from flask.json.provider import DefaultJSONProvider
 from . import routes
 import logging
 import os
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import redis
+    from flask_session import Session
+except ImportError:
+    redis = None
+    Session = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Create main blueprint
 bp = Blueprint('web', __name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, with Flask's default handling for other types."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 def create_app() -> Flask:
     """Create and configure Flask application."""
     app = Flask(__name__)
     
+    # Faster JSON responses when orjson is available
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    
     # Application configuration
     app.config.from_mapping(
         SECRET_KEY=os.getenv('FLASK_SECRET_KEY', 'dev-key-change-in-production'),
@@ -30,6 +61,9 @@ def create_app() -> Flask:
         PERMANENT_SESSION_LIFETIME=86400  # 24 hours
     )
     
+    # Server-side sessions in Redis when available (cookie only carries the session id)
+    configure_session_store(app)
+    
     # Configure template and static folders
     app.template_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
     app.static_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
@@ -43,5 +77,19 @@ def create_app() -> Flask:
     logger.info("Flask application created successfully")
     return app
 
-# Create the app instance for direct import
-app = create_app()
\ No newline at end of file
+def configure_session_store(app: Flask) -> None:
+    """Store sessions in Redis if REDIS_URL is set, otherwise keep signed-cookie sessions."""
+    redis_url = os.getenv('REDIS_URL')
+    if not redis_url:
+        return
+    if Session is None:
+        logger.warning("REDIS_URL is set but Flask-Session/redis are not installed, using cookie sessions")
+        return
+    
+    app.config.update(
+        SESSION_TYPE='redis',
+        SESSION_REDIS=redis.Redis.from_url(redis_url),
+        SESSION_KEY_PREFIX='chartastrophe:session:'
+    )
+    Session(app)
+    logger.info("Using Redis for sessions")
\ No newline at end of file
@@ -1,49 +1,224 @@
-from flask import Blueprint, jsonify, request, render_template, send_file, session
+from flask import Blueprint, jsonify, request, render_template, send_file, send_from_directory, session, g
+from werkzeug.datastructures import LanguageAccept
 from ..correlation.correlation_engine import CorrelationEngine
 from ..generator.explanation_generator import ExplanationGenerator
 from ..feedback.user_feedback import user_feedback
-from .translations import get_translation, get_supported_languages, get_language_names, TRANSLATIONS
-from functools import wraps
+from ..config import PERFORMANCE_CONFIG
+from .translations import get_translation, get_language_names, TRANSLATIONS, SUPPORTED_LANGUAGES, LANGUAGE_PREFERENCE
+from functools import wraps, lru_cache
+from concurrent.futures import Future
+from collections import OrderedDict
+import copy
+import itertools
+import os
 import time
+import uuid
 from datetime import datetime, timedelta
 import threading
 import logging
 import traceback
 from io import BytesIO
-import plotly.io as pio
 import numpy as np
-import plotly.graph_objects as go
-from scipy import stats
+
+try:
+    import redis
+except ImportError:
+    redis = None
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
 bp = Blueprint('web', __name__)
+STATIC_DIR = os.path.join(bp.root_path, 'static')
+STATIC_MAX_AGE = 31536000  # one year, in seconds
 correlation_engine = CorrelationEngine()
 explanation_generator = ExplanationGenerator()
 
 # Rate limiting configuration
 RATE_LIMIT = {
     'window_size': 60,  # in seconds
-    'max_requests': 30  # maximum number of requests per window
+    'max_requests': 30,  # maximum number of requests per window
+    'sweep_interval': 1000,  # requests between two sweeps of inactive clients
+    'redis_url': os.environ.get('REDIS_URL'),  # shared limiter across workers when set
+    'redis_timeout': 0.1  # in seconds, a slow Redis falls back to the in-process limiter
 }
 
-# Dictionary to store requests
+# Atomic sliding window log in Redis: one sorted set of request timestamps per client.
+# Returns -1 when the request is accepted, otherwise the seconds to wait.
+RATE_LIMIT_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local max_requests = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+if redis.call('ZCARD', key) >= max_requests then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    return math.max(1, math.ceil(tonumber(oldest[2]) + window - now))
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('EXPIRE', key, math.ceil(window))
+return -1
+"""
+
+def create_redis_rate_limiter():
+    """Register the Redis rate limit script, or return None to keep the in-process limiter."""
+    if not RATE_LIMIT['redis_url']:
+        return None
+    if redis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed, using in-process rate limiting")
+        return None
+    
+    client = redis.Redis.from_url(
+        RATE_LIMIT['redis_url'],
+        socket_timeout=RATE_LIMIT['redis_timeout'],
+        socket_connect_timeout=RATE_LIMIT['redis_timeout']
+    )
+    logger.info("Using Redis for rate limiting")
+    return client.register_script(RATE_LIMIT_SCRIPT)
+
+redis_rate_limiter = create_redis_rate_limiter()
+
+# Sliding window counter per client IP: [window index, previous window count, current window count]
 request_counts = {}
-request_lock = threading.Lock()
 
-# Simple cache to store correlations
-correlation_cache = {}
+# Striped locks: clients hashed to different stripes never wait on each other
+REQUEST_LOCK_STRIPES = 64
+request_locks = [threading.Lock() for _ in range(REQUEST_LOCK_STRIPES)]
+request_counter = itertools.count(1)
+sweep_lock = threading.Lock()
+
+# Correlation generations in progress per language, shared by concurrent requests
+inflight_generations = {}
+inflight_lock = threading.Lock()
+
+# Bounded LRU cache to store correlations (least recently used evicted first)
+CORRELATION_CACHE_SIZE = 10000
+correlation_cache = OrderedDict()
+correlation_cache_lock = threading.Lock()
+
+# Rendered share images (PNG bytes) by correlation id, bounded with the same LRU policy
+SHARE_IMAGE_CACHE_SIZE = 1000
+share_image_cache = OrderedDict()
+share_image_cache_lock = threading.Lock()
 
 def store_correlation(correlation):
     """Store a correlation in cache."""
     correlation_id = correlation.get('correlation_id', f'corr_{int(time.time())}')
-    correlation_cache[correlation_id] = correlation
+    with correlation_cache_lock:
+        correlation_cache[correlation_id] = correlation
+        correlation_cache.move_to_end(correlation_id)
+        while len(correlation_cache) > CORRELATION_CACHE_SIZE:
+            correlation_cache.popitem(last=False)
     return correlation_id
 
 def get_correlation(correlation_id):
     """Retrieve a correlation from cache."""
-    return correlation_cache.get(correlation_id)
+    with correlation_cache_lock:
+        correlation = correlation_cache.get(correlation_id)
+        if correlation is not None:
+            correlation_cache.move_to_end(correlation_id)
+        return correlation
+
+def get_cached_share_image(correlation_id):
+    """Retrieve the rendered share image of a correlation from cache."""
+    with share_image_cache_lock:
+        image_bytes = share_image_cache.get(correlation_id)
+        if image_bytes is not None:
+            share_image_cache.move_to_end(correlation_id)
+        return image_bytes
+
+def store_share_image(correlation_id, image_bytes):
+    """Store the rendered share image of a correlation in cache."""
+    with share_image_cache_lock:
+        share_image_cache[correlation_id] = image_bytes
+        share_image_cache.move_to_end(correlation_id)
+        while len(share_image_cache) > SHARE_IMAGE_CACHE_SIZE:
+            share_image_cache.popitem(last=False)
+
+def generate_correlations_coalesced(lang):
+    """Generate correlations, sharing a single engine run between concurrent requests for the same language."""
+    with inflight_lock:
+        future = inflight_generations.get(lang)
+        leader = future is None
+        if leader:
+            future = Future()
+            inflight_generations[lang] = future
+    
+    if leader:
+        try:
+            future.set_result(correlation_engine.generate_random_correlations(n_datasets=8, lang=lang))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with inflight_lock:
+                inflight_generations.pop(lang, None)
+    else:
+        logger.debug(f"Joining correlation generation already in progress for language: {lang}")
+    
+    # Each request gets its own copy; followers also get their own correlation IDs
+    correlations = copy.deepcopy(future.result(timeout=PERFORMANCE_CONFIG['timeout']))
+    if not leader:
+        for correlation in correlations:
+            correlation['correlation_id'] = str(uuid.uuid4())
+    return correlations
+
+def get_request_lock(client_ip):
+    """Return the lock stripe guarding a client's request counters."""
+    return request_locks[hash(client_ip) % REQUEST_LOCK_STRIPES]
+
+def sweep_inactive_clients(current_time):
+    """Drop clients with no request in the current or previous window."""
+    # A sweep already in progress in another thread is enough
+    if not sweep_lock.acquire(blocking=False):
+        return
+    
+    try:
+        window = int(current_time // RATE_LIMIT['window_size'])
+        for ip, counts in list(request_counts.items()):
+            with get_request_lock(ip):
+                if window - counts[0] >= 2:
+                    del request_counts[ip]
+    finally:
+        sweep_lock.release()
+
+def check_rate_limit_redis(client_ip, current_time):
+    """Record a request in Redis; return seconds to wait if the client is over the limit, else None."""
+    retry_after = redis_rate_limiter(
+        keys=[f"rate_limit:{client_ip}"],
+        args=[current_time, RATE_LIMIT['window_size'], RATE_LIMIT['max_requests'], uuid.uuid4().hex]
+    )
+    return None if retry_after < 0 else retry_after
+
+def check_rate_limit_local(client_ip, current_time):
+    """Record a request in process memory; return seconds to wait if the client is over the limit, else None."""
+    window_size = RATE_LIMIT['window_size']
+    window = int(current_time // window_size)
+    
+    with get_request_lock(client_ip):
+        counts = request_counts.get(client_ip)
+        if counts is None:
+            counts = request_counts[client_ip] = [window, 0, 0]
+        
+        # Shift counters when a new window starts
+        if counts[0] != window:
+            counts[1] = counts[2] if window == counts[0] + 1 else 0
+            counts[2] = 0
+            counts[0] = window
+        
+        # Previous window weighted by the part of it still inside the sliding window
+        elapsed = current_time - window * window_size
+        estimated = counts[1] * (1 - elapsed / window_size) + counts[2]
+        
+        if estimated >= RATE_LIMIT['max_requests']:
+            return int(window_size - elapsed) + 1
+        
+        counts[2] += 1
+    
+    # Periodically forget inactive clients to bound memory
+    if next(request_counter) % RATE_LIMIT['sweep_interval'] == 0:
+        sweep_inactive_clients(current_time)
+    
+    return None
 
 def rate_limit(f):
     @wraps(f)
@@ -51,59 +226,66 @@ def rate_limit(f):
         client_ip = request.remote_addr
         current_time = time.time()
         
-        with request_lock:
-            # Clean old entries
-            request_counts.clear()
-            
-            # Check and update counter
-            if client_ip in request_counts:
-                requests = request_counts[client_ip]
-                # Remove requests older than window
-                requests = [req for req in requests if current_time - req < RATE_LIMIT['window_size']]
-                
-                if len(requests) >= RATE_LIMIT['max_requests']:
-                    return jsonify({
-                        'status': 'error',
-                        'message': 'Too many requests. Please try again in a few minutes.',
-                        'retry_after': int(RATE_LIMIT['window_size'] - (current_time - requests[0]))
-                    }), 429
-                
-                requests.append(current_time)
-                request_counts[client_ip] = requests
-            else:
-                request_counts[client_ip] = [current_time]
+        retry_after = None
+        if redis_rate_limiter is not None:
+            try:
+                retry_after = check_rate_limit_redis(client_ip, current_time)
+            except Exception as e:
+                logger.warning(f"Redis rate limiting failed, using in-process limiter: {str(e)}")
+                retry_after = check_rate_limit_local(client_ip, current_time)
+        else:
+            retry_after = check_rate_limit_local(client_ip, current_time)
+        
+        if retry_after is not None:
+            return jsonify({
+                'status': 'error',
+                'message': 'Too many requests. Please try again in a few minutes.',
+                'retry_after': retry_after
+            }), 429
         
         return f(*args, **kwargs)
     return decorated_function
 
+def remember_language(lang):
+    """Persist the language in the session, only modifying it when something changes."""
+    # An unmodified session is not re-signed and re-sent as a cookie
+    if session.get('language') != lang:
+        session['language'] = lang
+    if not session.permanent:
+        session.permanent = True  # Make session persistent
+
 def get_user_language():
     """Récupère la langue de l'utilisateur depuis la session ou la requête."""
+    # Langue déjà déterminée pendant cette requête
+    if 'user_lang' in g:
+        return g.user_lang
+    
+    g.user_lang = detect_user_language()
+    return g.user_lang
+
+def detect_user_language():
+    """Détermine la langue de l'utilisateur (URL, session, navigateur, anglais par défaut)."""
     # 1. Vérifier si une langue est spécifiée dans l'URL
     lang = request.args.get('lang')
-    if lang and lang in get_supported_languages():
-        session['language'] = lang
-        session.permanent = True  # Make session persistent
+    if lang and lang in SUPPORTED_LANGUAGES:
+        remember_language(lang)
         logger.debug(f"Language set from URL: {lang}")
         return lang
     
     # 2. Vérifier la session
-    if 'language' in session and session['language'] in get_supported_languages():
+    if 'language' in session and session['language'] in SUPPORTED_LANGUAGES:
         logger.debug(f"Language from session: {session['language']}")
         return session['language']
     
-    # 3. Vérifier l'en-tête Accept-Language du navigateur
-    browser_lang = request.headers.get('Accept-Language', '')
-    if 'fr' in browser_lang.lower():
-        session['language'] = 'fr'
-        session.permanent = True
-        logger.debug(f"Language detected from browser: fr")
-        return 'fr'
-    
-    # 4. Par défaut: anglais
-    session['language'] = 'en'
-    session.permanent = True
-    logger.debug(f"Language defaulted to: en")
-    return 'en'
+    # 3. Vérifier l'en-tête Accept-Language du navigateur (en tenant compte des q-values),
+    #    anglais par défaut. Le joker '*' n'exprime aucune préférence : seules les langues
+    #    nommées sont comparées, sinon il désignerait la première de LANGUAGE_PREFERENCE
+    named_languages = LanguageAccept([(value, quality) for value, quality in request.accept_languages
+                                      if value != '*'])
+    browser_lang = named_languages.best_match(LANGUAGE_PREFERENCE, default='en')
+    remember_language(browser_lang)
+    logger.debug(f"Language detected from browser: {browser_lang}")
+    return browser_lang
 
 @bp.route('/')
 def index():
@@ -114,7 +296,7 @@ def index():
 @bp.route('/set_language/<lang>')
 def set_language(lang):
     """Définit la langue de l'utilisateur."""
-    if lang in get_supported_languages():
+    if lang in SUPPORTED_LANGUAGES:
         session['language'] = lang
     return jsonify({'status': 'success', 'language': session.get('language', 'en')})
 
@@ -155,24 +337,30 @@ def get_dataset_translations():
 @bp.route('/favicon.ico')
 def favicon():
     """Serve Chartastrophe ICO favicon."""
-    from flask import send_from_directory
-    import os
-    return send_from_directory(
-        os.path.join(bp.root_path, 'static'), 
-        'favicon.ico', 
-        mimetype='image/x-icon'
-    )
+    return send_static_asset('favicon.ico', 'image/x-icon')
 
 @bp.route('/favicon.svg')
 def favicon_svg():
     """Serve modern Chartastrophe SVG favicon."""
-    from flask import send_from_directory
-    import os
-    return send_from_directory(
-        os.path.join(bp.root_path, 'static'), 
-        'favicon.svg', 
-        mimetype='image/svg+xml'
-    )
+    return send_static_asset('favicon.svg', 'image/svg+xml')
+
+def send_static_asset(filename, mimetype):
+    """Send a static file with long-lived browser caching."""
+    response = send_from_directory(STATIC_DIR, filename, mimetype=mimetype, max_age=STATIC_MAX_AGE)
+    response.cache_control.immutable = True
+    return response
+
+# Explanation used when the engine returns none (shared, never mutated)
+FALLBACK_EXPLANATION = {
+    'fr': {
+        'title': "📊 Analyse statistique en cours",
+        'explanation': "Une corrélation intéressante a été détectée par nos algorithmes d'analyse. L'équipe de recherche étudie actuellement les implications de cette découverte dans un cadre méthodologique rigoureux."
+    },
+    'en': {
+        'title': "📊 Statistical analysis in progress",
+        'explanation': "An interesting correlation has been detected by our analysis algorithms. The research team is currently studying the implications of this discovery within a rigorous methodological framework."
+    }
+}
 
 @bp.route('/api/correlation/random')
 @rate_limit
@@ -191,7 +379,7 @@ def get_random_correlation():
         logger.info(f"🌐 Generating datasets with language: {user_lang}")
         
         # Generate correlation
-        correlations = correlation_engine.generate_random_correlations(n_datasets=8, lang=user_lang)
+        correlations = generate_correlations_coalesced(user_lang)
         
         if not correlations:
             logger.warning("No correlation generated")
@@ -208,18 +396,8 @@ def get_random_correlation():
         
         # Add fallback explanation if none exists
         if 'explanation' not in correlation or not correlation['explanation']:
-            user_lang = get_user_language()
-            logger.warning("No explanation found, generating fallback")
-            if user_lang == 'fr':
-                correlation['explanation'] = {
-                    'title': "📊 Analyse statistique en cours",
-                    'explanation': "Une corrélation intéressante a été détectée par nos algorithmes d'analyse. L'équipe de recherche étudie actuellement les implications de cette découverte dans un cadre méthodologique rigoureux."
-                }
-            else:
-                correlation['explanation'] = {
-                    'title': "📊 Statistical analysis in progress", 
-                    'explanation': "An interesting correlation has been detected by our analysis algorithms. The research team is currently studying the implications of this discovery within a rigorous methodological framework."
-                }
+            logger.warning("No explanation found, using fallback")
+            correlation['explanation'] = FALLBACK_EXPLANATION.get(user_lang, FALLBACK_EXPLANATION['en'])
         
         # Store correlation in cache
         correlation_id = store_correlation(correlation)
@@ -252,9 +430,7 @@ def get_correlation_graph(correlation_id):
                 'message': 'Correlation not found'
             }), 404
             
-        logger.debug("Generating graph data")
-        plot_data = generate_plot_data(correlation)
-        logger.debug("Graph data generated successfully")
+        plot_data = get_plot_json(correlation)
         
         return jsonify({
             'status': 'success',
@@ -268,8 +444,76 @@ def get_correlation_graph(correlation_id):
             'message': 'An error occurred while generating the graph.'
         }), 500
 
+# Static part of the correlation chart layout, patched per request in generate_plot_data
+AXIS_STYLE = {
+    'gridcolor': 'rgba(128,128,128,0.3)',
+    'gridwidth': 1,
+    'showline': True,
+    'linewidth': 2,
+    'linecolor': '#333',
+    'mirror': True
+}
+
+PLOT_BASE_LAYOUT = {
+    'title': {
+        'x': 0.5,
+        'font': {'size': 16, 'color': '#2c3e50'},
+        'xanchor': 'center'
+    },
+    'xaxis': AXIS_STYLE,
+    'yaxis': AXIS_STYLE,
+    'font': {'size': 12, 'family': "Arial, sans-serif"},
+    'plot_bgcolor': 'white',
+    'paper_bgcolor': 'white',
+    'showlegend': True,
+    'legend': {
+        'yanchor': "top",
+        'y': 0.99,
+        'xanchor': "left",
+        'x': 0.01,
+        'bgcolor': "rgba(255,255,255,0.9)",
+        'bordercolor': "rgba(0,0,0,0.3)",
+        'borderwidth': 1,
+        'font': {'size': 11}
+    },
+    'margin': {'l': 80, 'r': 40, 't': 100, 'b': 80},
+    'hovermode': 'closest'
+}
+
+PLOT_STATS_ANNOTATION = {
+    'x': 0.02,
+    'y': 0.02,
+    'xref': "paper",
+    'yref': "paper",
+    'showarrow': False,
+    'font': {'size': 10, 'color': "#666"},
+    'bgcolor': "rgba(255,255,255,0.8)",
+    'bordercolor': "rgba(0,0,0,0.2)",
+    'borderwidth': 1
+}
+
+# Statistics annotation text per (direction, strength) of the correlation
+STATS_ANNOTATION_TEXT = {
+    (direction, strength): f"<b>{strength} {direction} correlation</b><br>{{n_points}} points analyzed"
+    for direction in ('positive', 'negative')
+    for strength in ('strong', 'moderate', 'weak')
+}
+
+def get_plot_json(correlation):
+    """Plot JSON of a cached correlation, built on first use (it only depends on the correlation)."""
+    plot_data = correlation.get('plot_json')
+    if plot_data is None:
+        logger.debug("Generating graph data")
+        plot_data = generate_plot_data(correlation)
+        correlation['plot_json'] = plot_data
+        logger.debug("Graph data generated successfully")
+    return plot_data
+
 def generate_plot_data(correlation):
     """Generate data for chart with correlation line."""
+    import plotly.graph_objects as go  # deferred: only graph requests need Plotly
+    from scipy import stats
+    
     data_x = correlation.get('data_x', [])
     data_y = correlation.get('data_y', [])
     series1_name = correlation.get('series1_name', 'Variable 1')
@@ -277,8 +521,12 @@ def generate_plot_data(correlation):
     coef = correlation.get('correlation_coefficient', correlation.get('correlation', 0))
     sources = correlation.get('sources', [])
     
+    # Convert once for vectorized statistics (lists are kept for Plotly traces)
+    x = np.asarray(data_x, dtype=np.float64)
+    y = np.asarray(data_y, dtype=np.float64)
+    
     # Create scatter plot with colors by source
-    fig = go.Figure()
+    traces = []
     
     # Color palette for sources
     source_colors = [
@@ -300,7 +548,7 @@ def generate_plot_data(correlation):
     point_color = 'rgba(55, 126, 184, 0.7)'  # Uniform blue
     
             # Add points with unique color
-    fig.add_trace(go.Scatter(
+    traces.append(go.Scatter(
         x=data_x,
         y=data_y,
         mode='markers',
@@ -315,20 +563,21 @@ def generate_plot_data(correlation):
     ))
     
             # Calculate and add regression line with statistics
-    if len(data_x) > 1 and len(data_y) > 1:
-        slope, intercept, r_value, p_value, std_err = stats.linregress(data_x, data_y)
-        x_line = [min(data_x), max(data_x)]
-        y_line = [slope * x + intercept for x in x_line]
+    if len(x) > 1 and len(y) > 1:
+        slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
+        x_min, x_max = x.min(), x.max()
+        x_line = np.array([x_min, x_max])
+        y_line = slope * x_line + intercept
         
         # Confidence zone (approximate) more subtle
-        x_range = max(data_x) - min(data_x)
-        y_upper = [y + std_err * x_range * 0.05 for y in y_line]  # Smaller zone
-        y_lower = [y - std_err * x_range * 0.05 for y in y_line]
+        x_range = x_max - x_min
+        y_upper = y_line + std_err * x_range * 0.05  # Smaller zone
+        y_lower = y_line - std_err * x_range * 0.05
         
         # Add the confidence zone
-        fig.add_trace(go.Scatter(
-            x=x_line + x_line[::-1],
-            y=y_upper + y_lower[::-1],
+        traces.append(go.Scatter(
+            x=x_line.tolist() + x_line[::-1].tolist(),
+            y=y_upper.tolist() + y_lower[::-1].tolist(),
             fill='toself',
             fillcolor='rgba(255, 0, 0, 0.05)',  # Even more transparent
             line=dict(color='rgba(255,255,255,0)'),
@@ -338,9 +587,9 @@ def generate_plot_data(correlation):
         ))
         
         # Add regression line in dashed style
-        fig.add_trace(go.Scatter(
-            x=x_line,
-            y=y_line,
+        traces.append(go.Scatter(
+            x=x_line.tolist(),
+            y=y_line.tolist(),
             mode='lines',
             name=f'Linear regression (r={coef:.3f})',
             line=dict(color='red', width=1, dash='dash'),  # Dashed line
@@ -349,75 +598,36 @@ def generate_plot_data(correlation):
     
     # Calculate descriptive statistics for annotations
     n_points = len(data_x)
-    mean_x = sum(data_x) / len(data_x) if data_x else 0
-    mean_y = sum(data_y) / len(data_y) if data_y else 0
-    
-    # Format graph with more information
-    fig.update_layout(
-        title=dict(
-            text=f'<b>Correlation Analysis</b><br><i>{series1_name} vs {series2_name}</i><br><span style="font-size:12px">n = {n_points} observations • r = {coef:.3f}</span>',
-            x=0.5,
-            font=dict(size=16, color='#2c3e50'),
-            xanchor='center'
-        ),
-        xaxis=dict(
-            title=dict(
-                text=f'<b>{series1_name}</b><br><i>Moyenne: {mean_x:.2f}</i>',
-                font=dict(size=14)
-            ),
-            gridcolor='rgba(128,128,128,0.3)',
-            gridwidth=1,
-            showline=True,
-            linewidth=2,
-            linecolor='#333',
-            mirror=True
-        ),
-        yaxis=dict(
-            title=dict(
-                text=f'<b>{series2_name}</b><br><i>Moyenne: {mean_y:.2f}</i>',
-                font=dict(size=14)
-            ),
-            gridcolor='rgba(128,128,128,0.3)',
-            gridwidth=1,
-            showline=True,
-            linewidth=2,
-            linecolor='#333',
-            mirror=True
-        ),
-        font=dict(size=12, family="Arial, sans-serif"),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        showlegend=True,
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01,
-            bgcolor="rgba(255,255,255,0.9)",
-            bordercolor="rgba(0,0,0,0.3)",
-            borderwidth=1,
-            font=dict(size=11)
-        ),
-        margin=dict(l=80, r=40, t=100, b=80),
-        hovermode='closest'
-    )
+    mean_x = x.mean() if len(x) else 0
+    mean_y = y.mean() if len(y) else 0
     
     # Add annotation with statistics
     correlation_strength = "strong" if abs(coef) > 0.7 else "moderate" if abs(coef) > 0.4 else "weak"
     direction = "positive" if coef > 0 else "negative"
     
-    fig.add_annotation(
-        x=0.02,
-        y=0.02,
-        xref="paper",
-        yref="paper",
-        text=f"<b>{correlation_strength} {direction} correlation</b><br>{n_points} points analyzed",
-        showarrow=False,
-        font=dict(size=10, color="#666"),
-        bgcolor="rgba(255,255,255,0.8)",
-        bordercolor="rgba(0,0,0,0.2)",
-        borderwidth=1
-    )
+    # Patch the static layout with the per-correlation texts
+    layout = {
+        **PLOT_BASE_LAYOUT,
+        'title': {
+            **PLOT_BASE_LAYOUT['title'],
+            'text': f'<b>Correlation Analysis</b><br><i>{series1_name} vs {series2_name}</i><br><span style="font-size:12px">n = {n_points} observations • r = {coef:.3f}</span>'
+        },
+        'xaxis': {
+            **PLOT_BASE_LAYOUT['xaxis'],
+            'title': {'text': f'<b>{series1_name}</b><br><i>Moyenne: {mean_x:.2f}</i>', 'font': {'size': 14}}
+        },
+        'yaxis': {
+            **PLOT_BASE_LAYOUT['yaxis'],
+            'title': {'text': f'<b>{series2_name}</b><br><i>Moyenne: {mean_y:.2f}</i>', 'font': {'size': 14}}
+        },
+        'annotations': [{
+            **PLOT_STATS_ANNOTATION,
+            'text': STATS_ANNOTATION_TEXT[(direction, correlation_strength)].format(n_points=n_points)
+        }]
+    }
+    
+    # Build the figure in one go so Plotly validates the layout only once
+    fig = go.Figure(data=traces, layout=layout)
     
     return fig.to_json()
 
@@ -450,10 +660,35 @@ def share_correlation(correlation_id):
             t=translations, 
             language_names=get_language_names()), 500
 
+# Fonts tried in order for the share image
+SHARE_IMAGE_FONT_PATHS = [
+    'arial.ttf',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/System/Library/Fonts/Helvetica.ttc',
+    'C:\\Windows\\Fonts\\arial.ttf'
+]
+
+@lru_cache(maxsize=None)
+def load_share_fonts():
+    """Load the share image fonts (title, text, small) once per process."""
+    from PIL import ImageFont
+    
+    for font_path in SHARE_IMAGE_FONT_PATHS:
+        try:
+            return (ImageFont.truetype(font_path, 36),
+                    ImageFont.truetype(font_path, 24),
+                    ImageFont.truetype(font_path, 18))
+        except (OSError, IOError):
+            continue
+    
+    logger.warning("Unable to load system fonts. Using default fonts.")
+    default_font = ImageFont.load_default()
+    return default_font, default_font, default_font
+
 @bp.route('/api/correlation/share-image/<correlation_id>')
 def generate_share_image(correlation_id):
     try:
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
     except ImportError:
         return jsonify({'status': 'error', 'message': 'PIL (Pillow) is not installed'}), 500
     
@@ -461,11 +696,20 @@ def generate_share_image(correlation_id):
     if not correlation:
         return jsonify({'status': 'error', 'message': 'Correlation not found'}), 404
     
-    # Generate the graph in image format
-    fig = correlation.get_plot_figure() if hasattr(correlation, 'get_plot_figure') else None
-    if fig is None:
+    # The rendering is deterministic: reuse the image if it was already generated
+    cached_image = get_cached_share_image(correlation_id)
+    if cached_image is not None:
+        return send_file(BytesIO(cached_image), mimetype='image/png')
+    
+    # Generate the graph in image format, from the same figure as the graph endpoint
+    # (static export needs the kaleido package)
+    import plotly.io as pio
+    try:
+        fig = pio.from_json(get_plot_json(correlation))
+        plot_img = Image.open(BytesIO(pio.to_image(fig, format='png')))
+    except Exception as e:
+        logger.error(f"Unable to render graph for share image: {str(e)}")
         return jsonify({'status': 'error', 'message': 'Unable to generate graph'}), 500
-    plot_img = Image.open(BytesIO(pio.to_image(fig, format='png')))
     
     # Create larger image to contain graph and text
     width = 1200
@@ -474,40 +718,14 @@ def generate_share_image(correlation_id):
     
     # Add the title
     draw = ImageDraw.Draw(image)
-    try:
-        # First try common system fonts
-        font_paths = [
-            'arial.ttf',
-            '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-            '/System/Library/Fonts/Helvetica.ttc',
-            'C:\\Windows\\Fonts\\arial.ttf'
-        ]
-        
-        font_title = None
-        for font_path in font_paths:
-            try:
-                font_title = ImageFont.truetype(font_path, 36)
-                font_text = ImageFont.truetype(font_path, 24)
-                font_small = ImageFont.truetype(font_path, 18)
-                break
-            except (OSError, IOError):
-                continue
-        
-        if font_title is None:
-            raise OSError("No system fonts found")
-            
-    except Exception as e:
-        logger.warning(f"Unable to load system fonts: {str(e)}. Using default fonts.")
-        font_title = ImageFont.load_default()
-        font_text = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+    font_title, font_text, font_small = load_share_fonts()
     
     # Add the logo and title
     draw.text((50, 50), "Correlactions", fill='black', font=font_title)
-    draw.text((50, 100), getattr(correlation, 'title', ''), fill='black', font=font_text)
+    draw.text((50, 100), correlation.get('title', ''), fill='black', font=font_text)
     
     # Add the explanation
-    explanation = getattr(correlation, 'explanation', '')
+    explanation = correlation.get('explanation', '')
     explanation_lines = wrap_text(explanation, font_text, width - 100)
     y = 150
     for line in explanation_lines:
@@ -519,13 +737,13 @@ def generate_share_image(correlation_id):
     image.paste(plot_img, (50, 300))
     
     # Add the statistics
-    coef = getattr(correlation, 'correlation_coefficient', getattr(correlation, 'coefficient', 0))
+    coef = correlation.get('correlation_coefficient', correlation.get('correlation', 0))
     stats_text = f"Correlation coefficient: {coef:.1%}"
     draw.text((50, height - 250), stats_text, fill='black', font=font_text)
     
     # Add sources
-    source1 = getattr(correlation, 'series1_name', getattr(correlation, 'source_name_1', ''))
-    source2 = getattr(correlation, 'series2_name', getattr(correlation, 'source_name_2', ''))
+    source1 = correlation.get('series1_name', '')
+    source2 = correlation.get('series2_name', '')
     draw.text((50, height - 200), "Data sources:", fill='black', font=font_text)
     draw.text((50, height - 160), f"Variable 1 : {source1}", fill='black', font=font_small)
     draw.text((50, height - 130), f"Variable 2 : {source2}", fill='black', font=font_small)
@@ -535,28 +753,36 @@ def generate_share_image(correlation_id):
     
     # Save the image in memory
     img_io = BytesIO()
-    image.save(img_io, 'PNG')
+    image.save(img_io, 'PNG', optimize=False, compress_level=1)  # fast zlib level: served once or twice, then cached
+    store_share_image(correlation_id, img_io.getvalue())
     img_io.seek(0)
     
     return send_file(img_io, mimetype='image/png')
 
 def wrap_text(text, font, max_width):
     """Utility function to wrap text"""
+    if hasattr(font, 'getlength'):
+        measure = font.getlength
+    else:
+        measure = lambda s: font.getsize(s)[0]
+    
+    # Measure each word once and accumulate widths (linear in the number of words)
     words = text.split()
+    space_width = measure(' ')
     lines = []
     current_line = []
+    current_width = 0
     
     for word in words:
-        test_line = ' '.join(current_line + [word])
-        if hasattr(font, 'getlength'):
-            length = font.getlength(test_line)
-        else:
-            length = font.getsize(test_line)[0]
-        if length <= max_width:
+        word_width = measure(word)
+        added_width = word_width + space_width if current_line else word_width
+        if current_width + added_width <= max_width:
             current_line.append(word)
+            current_width += added_width
         else:
             lines.append(' '.join(current_line))
             current_line = [word]
+            current_width = word_width
     
     if current_line:
         lines.append(' '.join(current_line))
@@ -102,6 +102,18 @@ TRANSLATIONS = {
     }
 }
 
+# Langues supportées et leurs noms, calculés une seule fois
+SUPPORTED_LANGUAGES = frozenset(TRANSLATIONS.keys())
+
+# Même liste, dans un ordre fixe : départage les langues de même qualité dans Accept-Language
+# (l'ordre d'itération d'un frozenset dépend de PYTHONHASHSEED et varie d'un processus à l'autre)
+LANGUAGE_PREFERENCE = tuple(TRANSLATIONS)
+
+LANGUAGE_NAMES = {
+    'fr': 'Français',
+    'en': 'English'
+}
+
 def get_translation(lang, key, default=None):
     """
     Récupère une traduction pour une langue et une clé données.
@@ -121,12 +133,12 @@ def get_translation(lang, key, default=None):
 
 def get_supported_languages():
     """
-    Retourne la liste des langues supportées.
+    Retourne l'ensemble des langues supportées.
     
     Returns:
-        list: Liste des codes de langues supportées
+        frozenset: Ensemble des codes de langues supportées
     """
-    return list(TRANSLATIONS.keys())
+    return SUPPORTED_LANGUAGES
 
 def get_language_names():
     """
@@ -135,7 +147,4 @@ def get_language_names():
     Returns:
         dict: Dictionnaire des noms de langues
     """
-    return {
-        'fr': 'Français',
-        'en': 'English'
-    } 
\ No newline at end of file
+    return LANGUAGE_NAMES 
\ No newline at end of file
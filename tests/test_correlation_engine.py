@@ -2,24 +2,48 @@
 Unit tests for the correlation engine.
 """
 import unittest
+from unittest import mock
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
-from src.correlation.correlation_engine import CorrelationEngine
+from scipy import stats
+from src.config import PERFORMANCE_CONFIG
+from src.correlation.correlation_engine import CorrelationEngine, CORRELATION_DTYPE
+
+SCIPY_METHODS = {
+    'pearson': stats.pearsonr,
+    'spearman': stats.spearmanr,
+    'kendall': stats.kendalltau
+}
+
+def scipy_correlations(datasets, method):
+    """Reference (r, p) from scipy for every cross-dataset pair, on pairwise-complete rows."""
+    expected = {}
+    for d1, df1 in enumerate(datasets):
+        for d2 in range(d1 + 1, len(datasets)):
+            df2 = datasets[d2]
+            for c1, name1 in enumerate(df1.columns):
+                for c2, name2 in enumerate(df2.columns):
+                    rows = df1[name1].notna() & df2[name2].notna()
+                    coef, p_val = SCIPY_METHODS[method](df1[name1][rows], df2[name2][rows])
+                    expected[(d1, c1, d2, c2)] = (coef, p_val)
+    return expected
 
 class TestCorrelationEngine(unittest.TestCase):
-    def setUp(self):
-        """Initialize test data."""
-        self.engine = CorrelationEngine()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize test data once for all tests (tests must not modify it)."""
+        cls.engine = CorrelationEngine()
         
         # Create test data
-        np.random.seed(42)
-        self.data1 = pd.DataFrame({
-            'A': np.random.normal(0, 1, 100),
-            'B': np.random.normal(0, 1, 100)
+        rng = np.random.default_rng(42)
+        cls.data1 = pd.DataFrame({
+            'A': rng.standard_normal(100),
+            'B': rng.standard_normal(100)
         })
-        self.data2 = pd.DataFrame({
-            'C': self.data1['A'] * 2 + np.random.normal(0, 0.1, 100),  # Strong correlation with A
-            'D': np.random.normal(0, 1, 100)  # No correlation
+        cls.data2 = pd.DataFrame({
+            'C': cls.data1['A'] * 2 + rng.normal(0, 0.1, 100),  # Strong correlation with A
+            'D': rng.standard_normal(100)  # No correlation
         })
         
     def test_calculate_correlation(self):
@@ -78,5 +102,127 @@ class TestCorrelationEngine(unittest.TestCase):
         corr, p_value = self.engine.calculate_correlation(series1, series2)
         self.assertIsNotNone(corr)
         
+    def assertMatchesScipy(self, results, datasets, method):
+        """Check structured results against scipy for every pair (threshold 0)."""
+        expected = scipy_correlations(datasets, method)
+        self.assertEqual(len(results), len(expected))
+        for d1, c1, d2, c2, coef, p_val in results.tolist():
+            expected_coef, expected_p = expected[(d1, c1, d2, c2)]
+            self.assertAlmostEqual(coef, expected_coef, places=10)
+            np.testing.assert_allclose(p_val, expected_p, rtol=1e-6, atol=1e-12)
+            
+    def test_find_correlations_single_precision(self):
+        """Test that precision='f32' finds the same pairs as 'f64' within single precision."""
+        datasets = [self.data1, self.data2]
+        for method in ('pearson', 'spearman'):
+            with self.subTest(method=method):
+                f64 = self.engine.find_correlations(datasets, method=method, threshold=0.0, as_array=True)
+                f32 = self.engine.find_correlations(datasets, method=method, threshold=0.0,
+                                                    as_array=True, precision='f32')
+                np.testing.assert_array_equal(f32[['dataset1_index', 'column1_index',
+                                                   'dataset2_index', 'column2_index']],
+                                              f64[['dataset1_index', 'column1_index',
+                                                   'dataset2_index', 'column2_index']])
+                np.testing.assert_allclose(f32['correlation'], f64['correlation'], atol=1e-5)
+                # Pairs with |r| close to 1 are recomputed in double precision
+                near_one = np.abs(f64['correlation']) >= 0.99
+                self.assertTrue(near_one.any())
+                np.testing.assert_allclose(f32['correlation'][near_one], f64['correlation'][near_one], rtol=1e-12)
+                np.testing.assert_allclose(f32['p_value'][near_one], f64['p_value'][near_one], rtol=1e-9)
+                
+    def test_find_correlations_matches_scipy(self):
+        """Test every method on complete data against scipy."""
+        datasets = [self.data1, self.data2]
+        for method in ('pearson', 'spearman', 'kendall'):
+            with self.subTest(method=method):
+                results = self.engine.find_correlations(datasets, method=method, threshold=0.0, as_array=True)
+                self.assertMatchesScipy(results, datasets, method)
+                
+    def test_calculate_correlation_matches_scipy(self):
+        """Test calculate_correlation for every method, with missing values, against scipy."""
+        series1 = self.data1['A'].copy()
+        series1.iloc[[2, 50]] = np.nan
+        series2 = self.data2['C']
+        rows = series1.notna()
+        for method in ('pearson', 'spearman', 'kendall'):
+            with self.subTest(method=method):
+                corr, p_value = self.engine.calculate_correlation(series1, series2, method=method)
+                expected_corr, expected_p = SCIPY_METHODS[method](series1[rows], series2[rows])
+                self.assertAlmostEqual(corr, expected_corr, places=10)
+                np.testing.assert_allclose(p_value, expected_p, rtol=1e-6, atol=1e-12)
+                
+    def test_find_correlations_missing_values_matches_scipy(self):
+        """Test every method with missing values (pairwise-complete rows) against scipy."""
+        data1 = self.data1.copy()
+        data2 = self.data2.copy()
+        data1.loc[[3, 17, 42], 'A'] = np.nan
+        data2.loc[[17, 60], 'C'] = np.nan
+        data2.loc[[5, 99], 'D'] = np.nan
+        datasets = [data1, data2]
+        for method in ('pearson', 'spearman', 'kendall'):
+            with self.subTest(method=method):
+                results = self.engine.find_correlations(datasets, method=method, threshold=0.0, as_array=True)
+                self.assertMatchesScipy(results, datasets, method)
+                
+    def test_structured_results(self):
+        """Test that as_array results match the dicts and feed filtering and summary."""
+        datasets = [self.data1, self.data2]
+        as_dicts = self.engine.find_correlations(datasets, threshold=0.0)
+        as_array = self.engine.find_correlations(datasets, threshold=0.0, as_array=True)
+        self.assertEqual(as_array.dtype, CORRELATION_DTYPE)
+        np.testing.assert_allclose(as_array['correlation'], [c['correlation'] for c in as_dicts])
+        np.testing.assert_allclose(as_array['p_value'], [c['p_value'] for c in as_dicts])
+        
+        filtered_array = self.engine.filter_significant_correlations(as_array)
+        filtered_dicts = self.engine.filter_significant_correlations(as_dicts)
+        self.assertIsInstance(filtered_array, np.ndarray)
+        self.assertEqual(len(filtered_array), len(filtered_dicts))
+        
+        summary_array = self.engine.get_correlation_summary(as_array)
+        summary_dicts = self.engine.get_correlation_summary(as_dicts)
+        for key in ('nombre_total', 'correlation_moyenne', 'correlation_max', 'correlation_min', 'ecart_type'):
+            self.assertAlmostEqual(summary_array[key], summary_dicts[key])
+        self.assertEqual(self.engine.get_correlation_summary(as_array[:0]), {"message": "No correlation found"})
+        
+    def test_calculate_correlation_cache(self):
+        """Test that Kendall results are cached by content and Pearson/Spearman are computed directly."""
+        engine = CorrelationEngine()
+        with mock.patch.object(CorrelationEngine, '_correlate', wraps=CorrelationEngine._correlate) as correlate:
+            first = engine.calculate_correlation(self.data1['A'], self.data2['C'], method='kendall')
+            # Same values in new Series objects: cache hit
+            second = engine.calculate_correlation(self.data1['A'].copy(), self.data2['C'].copy(), method='kendall')
+            self.assertEqual(first, second)
+            self.assertEqual(correlate.call_count, 1)
+            
+            # Other data or other pairing: cache misses
+            engine.calculate_correlation(self.data1['A'], self.data2['D'], method='kendall')
+            engine.calculate_correlation(self.data2['C'], self.data1['A'], method='kendall')
+            self.assertEqual(correlate.call_count, 3)
+            
+            # Pearson and Spearman are never cached
+            for method in ('pearson', 'pearson', 'spearman', 'spearman'):
+                engine.calculate_correlation(self.data1['A'], self.data2['C'], method=method)
+            self.assertEqual(correlate.call_count, 7)
+        self.assertEqual(len(engine.correlation_cache), 3)
+        
+    def test_find_correlations_parallel_matches_scipy(self):
+        """Test the worker process path of the pairwise correlations against scipy."""
+        rng = np.random.default_rng(7)
+        datasets = [
+            pd.DataFrame(rng.standard_normal((30, 8)), columns=[f'X{i}' for i in range(8)]),
+            pd.DataFrame(rng.standard_normal((30, 8)), columns=[f'Y{i}' for i in range(8)])
+        ]
+        # 64 pairs, 16 per worker: two workers even on a single CPU machine
+        with mock.patch.dict(PERFORMANCE_CONFIG, {'max_workers': 2}), \
+                mock.patch('src.correlation.correlation_engine.available_cpus', return_value=2), \
+                mock.patch('src.correlation.correlation_engine.PARALLEL_MIN_PAIRS', 16), \
+                mock.patch('src.correlation.correlation_engine.ProcessPoolExecutor',
+                           wraps=ProcessPoolExecutor) as executor:
+            results = self.engine.find_correlations(datasets, method='kendall', threshold=0.0, as_array=True)
+        executor.assert_called_once()
+        self.assertEqual(executor.call_args.kwargs['max_workers'], 2)
+        self.assertNotEqual(executor.call_args.kwargs['mp_context'].get_start_method(), 'fork')
+        self.assertMatchesScipy(results, datasets, 'kendall')
+        
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+Unit tests for the web routes.
+"""
+import threading
+import unittest
+from collections import OrderedDict
+from io import BytesIO
+from unittest import mock
+from PIL import Image
+from src.web import routes
+from src.web.app import create_app
+
+def sample_correlation():
+    """Correlation shaped like the ones generated by CorrelationEngine."""
+    return {
+        'series1_name': 'Cheese consumption',
+        'series2_name': 'Bedsheet tanglings',
+        'correlation': 0.93,
+        'p_value': 0.001,
+        'title': 'Cheese and bedsheets',
+        'explanation': 'A surprisingly strong link between two unrelated series. ' * 5,
+        'data_x': [1.0, 2.0, 3.0, 4.0, 5.0],
+        'data_y': [2.1, 3.9, 6.2, 8.1, 9.8],
+        'sources': []
+    }
+
+class TestRoutes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Create the application once for all tests."""
+        cls.app = create_app()
+        cls.app.testing = True
+        
+    def setUp(self):
+        self.client = self.app.test_client()
+        
+    def test_share_image_rendered_and_cached(self):
+        """Test that the share image is rendered from a stored correlation, then served from the cache."""
+        correlation_id = routes.store_correlation(sample_correlation())
+        plot_png = BytesIO()
+        Image.new('RGB', (700, 500), 'white').save(plot_png, 'PNG')
+        
+        with mock.patch('plotly.io.to_image', return_value=plot_png.getvalue()) as to_image:
+            first = self.client.get(f'/api/correlation/share-image/{correlation_id}')
+            second = self.client.get(f'/api/correlation/share-image/{correlation_id}')
+        
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.mimetype, 'image/png')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(to_image.call_count, 1)
+        self.assertIsNotNone(routes.get_cached_share_image(correlation_id))
+        
+    def test_share_image_unknown_correlation(self):
+        """Test share image of an unknown correlation."""
+        response = self.client.get('/api/correlation/share-image/unknown')
+        self.assertEqual(response.status_code, 404)
+        
+    def test_language_from_accept_language(self):
+        """Test browser language detection: q-values first, French on ties, English for '*' or unknown."""
+        cases = {
+            'fr-FR,fr;q=0.9': 'fr',
+            'en-US,en;q=0.9,fr;q=0.1': 'en',
+            'fr;q=0.2,en;q=0.8': 'en',
+            'fr-FR,en-US': 'fr',
+            '*': 'en',
+            '*,fr;q=0.5': 'fr',
+            'de-DE,de;q=0.9': 'en',
+            '': 'en'
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                # New client each time: the detected language is remembered in the session
+                response = self.app.test_client().get('/', headers={'Accept-Language': header})
+                self.assertEqual(response.status_code, 200)
+                self.assertIn(f'<html lang="{expected}">'.encode(), response.data)
+                
+    def test_rate_limit_rejects_after_max_requests(self):
+        """Test that a client over the limit gets 429 while other clients are not affected."""
+        limited_ip, other_ip = '203.0.113.1', '203.0.113.2'
+        window_start = 1_000_000 * routes.RATE_LIMIT['window_size']
+        
+        # In-process limiter, clock frozen inside a single window
+        with mock.patch.object(routes, 'redis_rate_limiter', None), \
+                mock.patch('src.web.routes.time.time', return_value=window_start + 1):
+            for _ in range(routes.RATE_LIMIT['max_requests']):
+                response = self.client.get('/api/correlation/graph/unknown',
+                                           environ_base={'REMOTE_ADDR': limited_ip})
+                self.assertEqual(response.status_code, 404)
+            
+            response = self.client.get('/api/correlation/graph/unknown',
+                                       environ_base={'REMOTE_ADDR': limited_ip})
+            self.assertEqual(response.status_code, 429)
+            self.assertGreater(response.get_json()['retry_after'], 0)
+            
+            response = self.client.get('/api/correlation/graph/unknown',
+                                       environ_base={'REMOTE_ADDR': other_ip})
+            self.assertEqual(response.status_code, 404)
+        
+        # Two windows later the client is accepted again
+        with mock.patch.object(routes, 'redis_rate_limiter', None), \
+                mock.patch('src.web.routes.time.time',
+                           return_value=window_start + 2 * routes.RATE_LIMIT['window_size'] + 1):
+            response = self.client.get('/api/correlation/graph/unknown',
+                                       environ_base={'REMOTE_ADDR': limited_ip})
+            self.assertEqual(response.status_code, 404)
+            
+    def test_concurrent_generations_share_one_engine_run(self):
+        """Test that concurrent requests for a language share one engine run but get their own IDs."""
+        release = threading.Event()
+        calls = []
+        
+        def generate(n_datasets, lang):
+            calls.append(lang)
+            release.wait(5)
+            return [{**sample_correlation(), 'correlation_id': 'leader-id'}]
+        
+        class WatchedDict(dict):
+            """In-flight registry counting lookups, to know when every caller has joined."""
+            lookups = threading.Semaphore(0)
+            
+            def get(self, key, default=None):
+                WatchedDict.lookups.release()
+                return super().get(key, default)
+        
+        results = {}
+        def request(name):
+            results[name] = routes.generate_correlations_coalesced('fr')
+        
+        with mock.patch.object(routes.correlation_engine, 'generate_random_correlations', side_effect=generate), \
+                mock.patch.object(routes, 'inflight_generations', WatchedDict()):
+            threads = [threading.Thread(target=request, args=(name,)) for name in ('leader', 'follower1', 'follower2')]
+            threads[0].start()
+            WatchedDict.lookups.acquire(timeout=5)
+            for thread in threads[1:]:
+                thread.start()
+            for _ in threads[1:]:
+                WatchedDict.lookups.acquire(timeout=5)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+        
+        self.assertEqual(calls, ['fr'])
+        ids = [results[name][0]['correlation_id'] for name in ('leader', 'follower1', 'follower2')]
+        self.assertEqual(ids[0], 'leader-id')
+        self.assertEqual(len(set(ids)), 3)
+        # Each caller owns its copy
+        self.assertIsNot(results['follower1'][0], results['follower2'][0])
+        self.assertEqual(results['follower1'][0]['data_x'], results['leader'][0]['data_x'])
+        
+    def test_correlation_cache_evicts_least_recently_used(self):
+        """Test that the correlation cache drops the least recently used entry beyond its size."""
+        with mock.patch.object(routes, 'correlation_cache', OrderedDict()), \
+                mock.patch.object(routes, 'CORRELATION_CACHE_SIZE', 3):
+            for correlation_id in ('a', 'b', 'c'):
+                routes.store_correlation({**sample_correlation(), 'correlation_id': correlation_id})
+            
+            # Reading 'a' makes 'b' the least recently used entry
+            self.assertIsNotNone(routes.get_correlation('a'))
+            routes.store_correlation({**sample_correlation(), 'correlation_id': 'd'})
+            
+            self.assertIsNone(routes.get_correlation('b'))
+            self.assertEqual(list(routes.correlation_cache), ['c', 'a', 'd'])
+            self.assertEqual(self.client.get('/api/correlation/graph/b').status_code, 404)
+            self.assertEqual(self.client.get('/api/correlation/graph/a').status_code, 200)
+            
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Unit tests for the translation service.
+"""
+import unittest
+from src.services.translation_service import TranslationService
+
+class TestTranslationService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Create the service once for all tests (no translation file is loaded)."""
+        cls.service = TranslationService()
+        
+    def test_post_process_longest_correction_wins(self):
+        """Test that the longest correction applies instead of a shorter prefix."""
+        self.assertEqual(
+            self.service._post_process_translation('environmental indicators growth'),
+            'Croissance des indicateurs environnementaux'
+        )
+        self.assertEqual(
+            self.service._post_process_translation('Air Quality Transport'),
+            'Qualité des transports'
+        )
+        
+    def test_post_process_replacements_not_rematched(self):
+        """Test that a replaced text is not corrected again by another entry."""
+        self.assertEqual(
+            self.service._post_process_translation('qualité air transport'),
+            "Qualité de l'air transport"
+        )
+        
+    def test_post_process_several_corrections(self):
+        """Test several corrections in the same text."""
+        self.assertEqual(
+            self.service._post_process_translation('statistiques de naissance growth'),
+            'Statistiques de naissances croissance'
+        )
+        
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
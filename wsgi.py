@@ -20,22 +20,21 @@ except FileNotFoundError:
 
 logger = logging.getLogger('chartastrophe')
 
+# Application configuration, merged once at import (security settings take precedence)
+APP_CONFIG = {
+    **FLASK_CONFIG,
+    'SESSION_COOKIE_SECURE': False,  # True in production with HTTPS
+    'SESSION_COOKIE_HTTPONLY': True,
+    'SESSION_COOKIE_SAMESITE': 'Lax',
+    'PERMANENT_SESSION_LIFETIME': SECURITY_CONFIG['session_timeout'],
+    'MAX_CONTENT_LENGTH': SECURITY_CONFIG['max_file_size']
+}
+
 def create_application():
     """Create and configure Flask application."""
     try:
         app = create_app()
-        
-        # Security configuration
-        app.config.update(
-            SESSION_COOKIE_SECURE=False,  # True in production with HTTPS
-            SESSION_COOKIE_HTTPONLY=True,
-            SESSION_COOKIE_SAMESITE='Lax',
-            PERMANENT_SESSION_LIFETIME=SECURITY_CONFIG['session_timeout'],
-            MAX_CONTENT_LENGTH=SECURITY_CONFIG['max_file_size']
-        )
-        
-        # Configuration Flask depuis config.py
-        app.config.update(FLASK_CONFIG)
+        app.config.update(APP_CONFIG)
         
         logger.info("Chartastrophe application created successfully")
         return app
@@ -44,7 +43,7 @@ def create_application():
         logger.error(f"Error creating application: {e}")
         sys.exit(1)
 
-# Create the application
+# Create the application (wsgi.py is the only module that builds one)
 app = create_application()
 
 if __name__ == '__main__':
@@ -56,6 +55,11 @@ if __name__ == '__main__':
     logger.info(f"🎯 Environment: {env_config['ENV']}")
     logger.info(f"🔧 Debug: {'Enabled' if env_config['DEBUG'] else 'Disabled'}")
     
+    # The Werkzeug server is for development only: production runs under gunicorn
+    if env_config['ENV'] != 'development':
+        logger.warning("⚠️ Running the development server outside development: "
+                       "use 'gunicorn wsgi:app' (configured by gunicorn.conf.py) instead")
+    
     try:
         # Start server with optimized parameters
         app.run(